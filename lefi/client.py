@@ -34,11 +34,17 @@ from .ws import Shard, WebSocketClient
 from .voice import VoiceClient
 
 if TYPE_CHECKING:
+    import aiohttp
+
     from .objects import Intents
 
 __all__ = ("Client",)
 
 
+def _always_true(*_: Any) -> bool:
+    return True
+
+
 class Client:
     """The class used to communicate with the discord API and its gateway.
     A class used to communicate with the discord API and its gateway.
@@ -62,6 +68,10 @@ class Client:
         The :class:`asyncio.AbstractEventLoop` to use. If no loop is passed then the
         library will set a new event loop.
 
+    connector: Optional[:class:`aiohttp.BaseConnector`]
+        The connector to use for HTTP requests. If no connector is passed then a
+        pooled keep-alive connector is used.
+
     Attributes
     ----------
     loop: :class:`asyncio.AbstractEventLoop`
@@ -98,9 +108,10 @@ class Client:
         sharded: bool = False,
         shard_ids: Optional[List[int]] = None,
         loop: Optional[asyncio.AbstractEventLoop] = None,
+        connector: Optional[aiohttp.BaseConnector] = None,
     ) -> None:
         self.loop: asyncio.AbstractEventLoop = loop or self._create_loop()
-        self.http: HTTPClient = HTTPClient(token, self.loop)
+        self.http: HTTPClient = HTTPClient(token, self.loop, connector)
         self._state: State = State(self, self.loop)
         self.ws: WebSocketClient = WebSocketClient(self, intents, shard_ids, sharded)
 
@@ -304,6 +315,7 @@ class Client:
         else:
             await self.ws.close()
 
+        self._state.io_executor.shutdown(wait=False)
         return None
 
     def run(self) -> None:
@@ -368,10 +380,7 @@ class Client:
         future = self.loop.create_future()
         futures = self.futures.setdefault(event, [])
 
-        if check is None:
-            check = lambda *_: True
-
-        futures.append((future, check))
+        futures.append((future, check if check is not None else _always_true))
         return await asyncio.wait_for(future, timeout=timeout)
 
     async def on_error(self, event: str, error: Exception) -> None:
@@ -1,49 +1,89 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Dict, List, Optional
 
 from aiohttp import web
 
 from lefi import InteractionType
+from lefi.utils import from_json
 
 from nacl.signing import VerifyKey
 from nacl.exceptions import BadSignatureError
 
+if TYPE_CHECKING:
+    from lefi.http import HTTPClient
+
 __all__ = ("InteractionWeb",)
 
+_PING = InteractionType.PING.value
+_COMMAND = InteractionType.COMMAND.value
+
 
 class InteractionWeb:
+    __slots__ = ("application_id", "verify_key", "server", "commands", "command_payloads")
+
     def __init__(self, application_id: int, public_key: str) -> None:
         self.application_id = application_id
         self.verify_key = VerifyKey(bytes.fromhex(public_key))
+        self.commands: Dict[str, Callable[[dict], Coroutine[Any, Any, dict]]] = {}
+        self.command_payloads: Dict[str, dict] = {}
 
         self.server = web.Application()
         self.server.add_routes([web.post("/", self.handle_interactions)])  # type: ignore
 
+    def command(
+        self, name: Optional[str] = None, description: Optional[str] = None, options: Optional[List[dict]] = None
+    ) -> Callable[..., Callable[[dict], Coroutine[Any, Any, dict]]]:
+        def decorator(func: Callable[[dict], Coroutine[Any, Any, dict]]) -> Callable[[dict], Coroutine[Any, Any, dict]]:
+            command_name = name or func.__name__
+            payload: Dict[str, Any] = {"name": command_name, "description": description or func.__doc__ or command_name}
+            if options is not None:
+                payload["options"] = options
+
+            self.commands[command_name] = func
+            self.command_payloads[command_name] = payload
+            return func
+
+        return decorator
+
+    async def register_commands(self, http: HTTPClient, guild_id: Optional[int] = None) -> List[dict]:
+        # Every command is sent in one bulk overwrite instead of a request per command.
+        commands = list(self.command_payloads.values())
+        if guild_id is None:
+            return await http.bulk_overwrite_global_application_commands(self.application_id, commands=commands)
+
+        return await http.bulk_overwrite_guild_application_commands(self.application_id, guild_id, commands=commands)
+
     async def validate_security(self, request: web.Request) -> bool:
         signature: Optional[str] = request.headers.get("X-Signature-Ed25519")
         timestamp: Optional[str] = request.headers.get("X-Signature-Timestamp")
-        body = (await request.read()).decode("utf-8")
+        body = await request.read()
 
-        if signature or timestamp is None:
+        # An Ed25519 signature is 64 bytes, so anything that isn't 128 hex digits
+        # can be rejected without touching the key.
+        if signature is None or timestamp is None or len(signature) != 128:
             return False
 
         try:
-            self.verify_key.verify(f"{timestamp}{body}".encode(), bytes.fromhex(signature))  # type: ignore
+            self.verify_key.verify(timestamp.encode() + body, bytes.fromhex(signature))
             return True
-        except BadSignatureError:
+        except (BadSignatureError, ValueError):
             return False
 
     async def handle_interactions(self, request: web.Request) -> web.Response:
         if not await self.validate_security(request):
             return web.Response(text="Could not verify request was from discord.", status=401)
 
-        data = await request.json()
-        interaction_type = InteractionType(data["type"])
-
-        if interaction_type is InteractionType.PING:
+        data = from_json(await request.read())
+        interaction_type = data["type"]
+        if interaction_type == _PING:
             return web.json_response({"type": 1})
 
+        if interaction_type == _COMMAND:
+            callback = self.commands.get(data["data"]["name"])
+            if callback is not None:
+                return web.json_response(await callback(data))
+
         return web.json_response({})
 
     async def start(self) -> None:
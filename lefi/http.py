@@ -2,15 +2,18 @@ from __future__ import annotations
 
 import asyncio
 import aiohttp
+import functools
+import itertools
 
 import logging
-import json
+import sys
+import uuid
 
-from typing import Any, ClassVar, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Awaitable, ClassVar, Dict, List, Optional, Tuple, Union
 
 from .errors import BadRequest, Forbidden, NotFound, Unauthorized
-from .ratelimiter import Ratelimiter
-from .utils import bytes_to_data_uri, update_payload
+from .ratelimiter import BucketState, Ratelimiter
+from .utils import bytes_to_data_uri, from_json, to_json, update_payload
 from .objects import File
 
 __all__ = (
@@ -22,6 +25,35 @@ logger = logging.getLogger(__name__)
 
 BASE: str = "https://discord.com/api/v9"
 
+Bucket = Tuple[Optional[int], Optional[int], Optional[int], str]
+
+_GET, _POST, _PATCH, _PUT, _DELETE = map(sys.intern, ("GET", "POST", "PATCH", "PUT", "DELETE"))
+
+# Discord treats missing query flags as false, and aiohttp can't encode bools,
+# so the query strings for ``get_invite`` are built once up front.
+_INVITE_PARAMS: Dict[Tuple[bool, bool], Optional[Dict[str, str]]] = {
+    (False, False): None,
+    (True, False): {"with_counts": "true"},
+    (False, True): {"with_expiration": "true"},
+    (True, True): {"with_counts": "true", "with_expiration": "true"},
+}
+
+# Followup messages are sent while the user is waiting on the interaction, so a slow
+# response is cut off instead of holding one of the request slots.
+_FOLLOWUP_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+
+def _read_timeout(timeout: Optional[float]) -> Dict[str, Any]:
+    return {"timeout": aiohttp.ClientTimeout(total=timeout)} if timeout is not None else {}
+
+
+_GLOBAL_COMMANDS = "/applications/{application_id}/commands"
+_GLOBAL_COMMAND = "/applications/{application_id}/commands/{command_id}"
+_GUILD_COMMANDS = "/applications/{application_id}/guilds/{guild_id}/commands"
+_GUILD_COMMAND = "/applications/{application_id}/guilds/{guild_id}/commands/{command_id}"
+_GUILD_COMMANDS_PERMISSIONS = "/applications/{application_id}/guilds/{guild_id}/commands/permissions"
+_GUILD_COMMAND_PERMISSIONS = "/applications/{application_id}/guilds/{guild_id}/commands/{command_id}/permissions"
+
 
 class Route:
     """A class representing an endpoint.
@@ -58,9 +90,12 @@ class Route:
     webhook_token: Optional[:class:`str`]
         The webhook_token being used in the endpoint if there is any
 
-    lock: :class:`asyncio.Lock`
-        The internal lock to use for ratelimiting. This is acquired when
-        the bucket is depleted.
+    bucket: Tuple[Optional[:class:`int`], Optional[:class:`int`], Optional[:class:`int`], :class:`str`]
+        The bucket of the route, made out of the major parameters and the path.
+
+    state: Optional[:class:`.BucketState`]
+        The ratelimit state of the route's bucket. This is shared between routes
+        with the same bucket and is set the first time the route is requested.
     """
 
     def __init__(self, path: str, **kwargs) -> None:
@@ -70,19 +105,54 @@ class Route:
         self.channel_id: Optional[int] = kwargs.get("channel_id")
         self.guild_id: Optional[int] = kwargs.get("guild_id")
         self.webhook_id: Optional[int] = kwargs.get("webhook_id")
-        self.webhook_token: Optional[str] = kwargs.get("webhookd_token")
+        self.webhook_token: Optional[str] = kwargs.get("webhook_token")
 
-        self.lock: asyncio.Lock = asyncio.Lock()
+        self.bucket: Bucket = (self.channel_id, self.guild_id, self.webhook_id, path)
+        self.state: Optional[BucketState] = None
 
     @property
     def url(self) -> str:
         """The final url of the route."""
         return f"{BASE+self.path}"
 
-    @property
-    def bucket(self) -> str:
-        """The bucket of the route."""
-        return f"{self.channel_id}:{self.guild_id}:{self.webhook_id}:{self.path}"
+
+@functools.lru_cache(maxsize=4096)
+def _command_path(
+    template: str, application_id: int, guild_id: Optional[int] = None, command_id: Optional[int] = None
+) -> str:
+    # Application command paths are requested over and over with the same ids, so they're only formatted once.
+    return template.format(application_id=application_id, guild_id=guild_id, command_id=command_id)
+
+
+def _command_route(
+    template: str, application_id: int, guild_id: Optional[int] = None, command_id: Optional[int] = None
+) -> Route:
+    # The route itself is built fresh every time. It carries the ratelimit state of whichever client
+    # requests it first, so sharing it would make every client in the process share one bucket.
+    path = _command_path(template, application_id, guild_id, command_id)
+    return Route(path, guild_id=guild_id)
+
+
+def _interaction_messages(application_id: int, interaction_token: str) -> str:
+    # Every response and followup of an interaction shares this prefix. It isn't cached,
+    # since that would keep the secret interaction tokens around long after they expire.
+    return f"/webhooks/{application_id}/{interaction_token}/messages"
+
+
+def _embed_length(embed: dict) -> int:
+    # The text discord counts towards the 6000 character limit shared by every embed in a message.
+    fields = embed.get("fields") or ()
+    return sum(
+        len(text or "")
+        for text in (
+            embed.get("title"),
+            embed.get("description"),
+            (embed.get("footer") or {}).get("text"),
+            (embed.get("author") or {}).get("name"),
+            *(field.get("name") for field in fields),
+            *(field.get("value") for field in fields),
+        )
+    )
 
 
 class HTTPClient:
@@ -99,6 +169,9 @@ class HTTPClient:
         The token to use for authorization
     loop: :class:`asyncio.AbstractEventLoop`
         The loop to use
+    connector: Optional[:class:`aiohttp.BaseConnector`]
+        The connector to use for the client session. If this isn't passed
+        a pooled :class:`aiohttp.TCPConnector` with keep-alive is created.
 
     Attributes
     ----------
@@ -108,14 +181,43 @@ class HTTPClient:
     loop: :class:`asyncio.AbstractEventLoop`
         The loop to use
 
+    connector: Optional[:class:`aiohttp.BaseConnector`]
+        The connector passed to the constructor, if any
+
     session: :class:`aiohttp.ClientSession`
         The client session to use for making requests
 
-    semaphores: Dict[str, :class:`asyncio.Semaphore`]
-        A mapping of buckets and semaphores. This is used for
-        concurrent requests without getting ratelimited.
+    buckets: Dict[Tuple, :class:`.BucketState`]
+        A mapping of buckets and their ratelimit state, which is
+        updated from the headers of every response.
+
+    global_ratelimit: :class:`asyncio.Event`
+        The global ratelimit event. This is cleared while
+        the client is globally ratelimited.
+
+    concurrency: :class:`asyncio.Semaphore`
+        A semaphore limiting the amount of requests in flight
+        at once to :attr:`MAX_CONCURRENCY`.
+
+    pending_guild_commands: Dict[:class:`int`, List[:class:`dict`]]
+        A mapping of guild ids and the application commands queued
+        by :meth:`queue_guild_application_command`.
     """
 
+    __slots__ = (
+        "token",
+        "loop",
+        "connector",
+        "session",
+        "buckets",
+        "global_ratelimit",
+        "concurrency",
+        "pending_guild_commands",
+        "_boundary_prefix",
+        "_boundaries",
+    )
+
+    MAX_CONCURRENCY: ClassVar[int] = 64
     ERRORS: ClassVar[Dict[int, Any]] = {
         400: BadRequest,
         401: Unauthorized,
@@ -123,18 +225,30 @@ class HTTPClient:
         404: NotFound,
     }
 
-    def __init__(self, token: str, loop: asyncio.AbstractEventLoop) -> None:
+    def __init__(
+        self,
+        token: str,
+        loop: asyncio.AbstractEventLoop,
+        connector: Optional[aiohttp.BaseConnector] = None,
+    ) -> None:
         self.token: str = token
         self.loop: asyncio.AbstractEventLoop = loop
+        self.connector: Optional[aiohttp.BaseConnector] = connector
         self.session: aiohttp.ClientSession = None  # type: ignore
-        self.semaphores: Dict[str, asyncio.Semaphore] = {}
+        self.buckets: Dict[Bucket, BucketState] = {}
+        self.global_ratelimit: asyncio.Event = asyncio.Event()
+        self.concurrency: asyncio.Semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+        self.pending_guild_commands: Dict[int, List[dict]] = {}
+        self._boundary_prefix: str = uuid.uuid4().hex
+        self._boundaries = itertools.count()
+        self.global_ratelimit.set()
 
     @staticmethod
     async def json_or_text(resp: aiohttp.ClientResponse) -> Union[dict, str]:
         """A method which returns a response's text or json.
 
         This is a utility method, to return a :class:`aiohttp.ClientResponse`'s
-        text or json.
+        text or json. JSON is decoded with ``orjson`` if it is installed.
 
         Parameters
         ----------
@@ -148,7 +262,7 @@ class HTTPClient:
             :meth:`aiohttp.ClientResponse.text`
         """
         try:
-            return await resp.json()
+            return await resp.json(loads=from_json)
         except aiohttp.ContentTypeError:
             return await resp.text()
 
@@ -158,6 +272,10 @@ class HTTPClient:
         This method is used to create the internal :class:`aiohttp.ClientSession` that
         is used for making every API call currently supported.
 
+        Every request goes to the same host, so the session keeps a pool of
+        keep-alive connections around instead of doing a new TCP and TLS handshake
+        for each request. DNS lookups are cached for 5 minutes.
+
         Parameters
         ----------
         loop: :class:`asyncio.AbstractEventLoop`
@@ -168,7 +286,33 @@ class HTTPClient:
         :class:`aiohttp.ClientSession`
             The created client session.
         """
-        return aiohttp.ClientSession(loop=self.loop or loop)
+        connector = self.connector or aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=50,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True,
+        )
+
+        return aiohttp.ClientSession(
+            loop=self.loop or loop,
+            connector=connector,
+            connector_owner=self.connector is None,
+            json_serialize=to_json,
+        )
+
+    def next_boundary(self) -> str:
+        """Creates a boundary for a multipart request.
+
+        Boundaries are a random prefix made once per client followed by a counter,
+        so no random bytes are generated for each upload.
+
+        Returns
+        -------
+        :class:`str`
+            The boundary to use
+        """
+        return f"{self._boundary_prefix}{next(self._boundaries):016x}"
 
     async def close(self) -> None:
         """A method which closes the internal :class:`aiohttp.ClientSession`"""
@@ -210,20 +354,67 @@ class HTTPClient:
         if reason := kwargs.get("reason"):
             headers["X-Audit-Log-Reason"] = reason
 
-        if form := kwargs.pop("form", []):
-            formdata = aiohttp.FormData()
-            payload = kwargs.pop("json", None)
+        async with Ratelimiter(self, route, method, **kwargs, headers=headers) as handler:
+            return await handler.request()
+
+    async def _request_path(
+        self,
+        method: str,
+        path: str,
+        *,
+        channel_id: Optional[int] = None,
+        guild_id: Optional[int] = None,
+        webhook_id: Optional[int] = None,
+        webhook_token: Optional[str] = None,
+        **kwargs,
+    ) -> Any:
+        """A shortcut for :meth:`request` which builds the :class:`.Route` itself.
+
+        This is used by the ``_get``, ``_post``, ``_patch``, ``_put`` and ``_delete`` shortcuts
+        so that endpoint methods don't have to construct the route themselves.
 
-            if payload:
-                formdata.add_field("payload_json", value=json.dumps(payload))
+        Parameters
+        ----------
+        method: :class:`str`
+            The method to request with. E.g `POST` and `GET`
 
-            for params in form:
-                formdata.add_field(**params)
+        path: :class:`str`
+            The path of the endpoint
 
-            kwargs["data"] = formdata
+        channel_id: Optional[:class:`int`]
+            The channel_id major parameter of the endpoint
 
-        async with Ratelimiter(self, route, method, **kwargs, headers=headers) as handler:
-            return await handler.request()
+        guild_id: Optional[:class:`int`]
+            The guild_id major parameter of the endpoint
+
+        webhook_id: Optional[:class:`int`]
+            The webhook_id major parameter of the endpoint
+
+        webhook_token: Optional[:class:`str`]
+            The webhook_token major parameter of the endpoint
+
+        **kwargs: Any
+            Extra kwargs to pass to :meth:`request`
+
+        Returns
+        -------
+        Any
+            The return data of the request
+        """
+        route = Route(
+            path,
+            channel_id=channel_id,
+            guild_id=guild_id,
+            webhook_id=webhook_id,
+            webhook_token=webhook_token,
+        )
+        return await self.request(method, route, **kwargs)
+
+    _get = functools.partialmethod(_request_path, _GET)
+    _post = functools.partialmethod(_request_path, _POST)
+    _patch = functools.partialmethod(_request_path, _PATCH)
+    _put = functools.partialmethod(_request_path, _PUT)
+    _delete = functools.partialmethod(_request_path, _DELETE)
 
     async def get_bot_gateway(self) -> dict:
         """A method which makes an API call to get bot's gateway.
@@ -264,16 +455,21 @@ class HTTPClient:
         """
         return await self.session.ws_connect(url)
 
-    async def read_from_url(self, url: str) -> bytes:
+    async def read_from_url(self, url: str, *, timeout: Optional[float] = None) -> bytes:
         """A method to read the data from a url.
 
         This method is mostly here as a utility method, used in some places.
+        Cancelling the caller closes the underlying connection straight away.
 
         Parameters
         ----------
         url: :class:`str`
             The url to read the data from
 
+        timeout: Optional[:class:`float`]
+            The total amount of seconds the read may take.
+            Defaults to the session's timeout
+
         Raises
         ------
         :exc:`aiohttp.ClientResponseError`
@@ -284,20 +480,58 @@ class HTTPClient:
         :class:`bytes`
             The data read from the url.
         """
-        async with self.session.get(url) as resp:
+        async with self.session.get(url, **_read_timeout(timeout)) as resp:
             return await resp.read()
 
+    async def read_stream(
+        self, url: str, chunk_size: int = 65536, *, timeout: Optional[float] = None
+    ) -> AsyncIterator[bytes]:
+        """A method to read the data from a url in chunks.
+
+        Unlike :meth:`read_from_url` the data is never held in memory all at once,
+        and cancellation takes effect between chunks.
+
+        Parameters
+        ----------
+        url: :class:`str`
+            The url to read the data from
+
+        chunk_size: :class:`int`
+            The maximum size of each chunk
+
+        timeout: Optional[:class:`float`]
+            The total amount of seconds the read may take.
+            Defaults to the session's timeout
+
+        Raises
+        ------
+        :exc:`aiohttp.ClientResponseError`
+            Raised when the url cannot be read.
+
+        Yields
+        ------
+        :class:`bytes`
+            The chunks of data read from the url.
+        """
+        async with self.session.get(url, **_read_timeout(timeout)) as resp:
+            async for chunk in resp.content.iter_chunked(chunk_size):
+                yield chunk
+
     async def login(self) -> None:
         """A method which is used to validate the token.
 
         This method is used to simulate logging in. It's used to check
-        if the authorization token is valid by requesting ``/users/@me``
+        if the authorization token is valid by requesting ``/users/@me``.
+        The client session is created here, so it's set up before any other request.
 
         Raises
         ------
         :exc:`.Unauthorized`
             The token is not valid.
         """
+        if self.session is None or self.session.closed:
+            self.session = await self._create_session()
+
         try:
             await self.get_current_user()
         except (Forbidden, Unauthorized):
@@ -307,6 +541,10 @@ class HTTPClient:
         """A method which builds a form.
 
         This method builds a form which is used for file uploads.
+        The file's underlying file object is passed as the value, which
+        aiohttp streams in chunks instead of reading the whole file into memory.
+        The size of the file is taken from the file object, so the request is sent
+        with a ``Content-Length`` instead of chunked transfer encoding.
 
         Parameters
         ----------
@@ -324,9 +562,9 @@ class HTTPClient:
         """
         return {
             "name": f"file-{index}" if index else "file",
-            "value": file.fp,
+            "value": file.source,
             "filename": file.filename,
-            "content_type": "application/octect-stream",
+            "content_type": "application/octet-stream",
         }
 
     def form_helper(self, files: Optional[List[Optional[File]]] = None) -> List[dict]:
@@ -630,9 +868,11 @@ class HTTPClient:
             A list of dicts representing message objects.
 
         """
-        params = {"limit": limit}
-
-        update_payload(params, around=around, before=before, after=after)
+        params = {
+            key: value
+            for key, value in (("limit", limit), ("around", around), ("before", before), ("after", after))
+            if value is not None
+        }
 
         return await self.request(
             "GET",
@@ -736,7 +976,7 @@ class HTTPClient:
             A dict representing the sent message object
         """
         payload = {"tts": tts}
-        form = self.form_helper(files)  # type: ignore
+        form = self.form_helper(files) if files else None  # type: ignore
 
         update_payload(
             payload,
@@ -2745,8 +2985,7 @@ class HTTPClient:
         """
         return await self.request(
             "DELETE",
-            Route(f"/guilds/{guild_id}/members/{member_id}"),
-            guild_id=guild_id,
+            Route(f"/guilds/{guild_id}/members/{member_id}", guild_id=guild_id),
         )
 
     async def get_guild_bans(self, guild_id: int) -> List[dict]:
@@ -2769,7 +3008,7 @@ class HTTPClient:
         List[:class:`dict`]
             A list of dicts representing a ban object.
         """
-        return await self.request("GET", Route(f"/guilds/{guild_id}/bans"), guild_id=guild_id)
+        return await self.request("GET", Route(f"/guilds/{guild_id}/bans", guild_id=guild_id))
 
     async def get_guild_ban(self, guild_id: int, user_id: int) -> dict:
         """A method which fetches a user ban from the guild.
@@ -2797,7 +3036,7 @@ class HTTPClient:
         :class:`dict`
             A dict representing a ban object.
         """
-        return await self.request("GET", Route(f"/guilds/{guild_id}/bans/{user_id}"), guild_id=guild_id)
+        return await self.request("GET", Route(f"/guilds/{guild_id}/bans/{user_id}", guild_id=guild_id))
 
     async def create_guild_ban(self, guild_id: int, user_id: int, *, delete_message_days: int = 0) -> None:
         """This method bans a user from the guild.
@@ -2848,7 +3087,7 @@ class HTTPClient:
         :exc:`.HTTPException`
             Something went wrong while making the request.
         """
-        return await self.request("DELETE", Route(f"/guilds/{guild_id}/bans/{user_id}"), guild_id=guild_id)
+        return await self.request("DELETE", Route(f"/guilds/{guild_id}/bans/{user_id}", guild_id=guild_id))
 
     async def get_guild_roles(self, guild_id: int) -> List[dict]:
         """A method which fetches a list of the guild's roles.
@@ -2870,7 +3109,7 @@ class HTTPClient:
         List[:class:`dict`]
             A list of dicts representing a role.
         """
-        return await self.request("GET", Route(f"/guilds/{guild_id}/roles"), guild_id=guild_id)
+        return await self.request("GET", Route(f"/guilds/{guild_id}/roles", guild_id=guild_id))
 
     async def create_guild_role(
         self,
@@ -3049,7 +3288,7 @@ class HTTPClient:
         :exc:`.NotFound`
             The role id was invalid or already deleted.
         """
-        return await self.request("DELETE", Route(f"/guilds/{guild_id}/roles/{role_id}"), guild_id=guild_id)
+        return await self.request("DELETE", Route(f"/guilds/{guild_id}/roles/{role_id}", guild_id=guild_id))
 
     async def get_guild_prune_count(
         self, guild_id: int, *, days: int = 7, include_roles: Optional[List[int]] = None
@@ -3154,7 +3393,7 @@ class HTTPClient:
         List[:class:`dict`]
             A list of voice regions for the guild.
         """
-        return await self.request("GET", Route(f"/guilds/{guild_id}/regions"), guild_id=guild_id)
+        return await self.request("GET", Route(f"/guilds/{guild_id}/regions", guild_id=guild_id))
 
     async def get_guild_invites(self, guild_id: int) -> List[dict]:
         """Fetches a list of invites from the guild.
@@ -3176,7 +3415,7 @@ class HTTPClient:
         List[:class:`dict`]
             A list of dicts representing an invite objects.
         """
-        return await self.request("GET", Route(f"/guilds/{guild_id}/invites"), guild_id=guild_id)
+        return await self.request("GET", Route(f"/guilds/{guild_id}/invites", guild_id=guild_id))
 
     async def get_guild_integrations(self, guild_id: int) -> List[dict]:
         """Fetches a list of integrations in the guild.
@@ -3198,7 +3437,7 @@ class HTTPClient:
         List[:class:`dict`]
             A list of dicts representing integration objects.
         """
-        return await self.request("GET", Route(f"/guilds/{guild_id}/integrations"), guild_id=guild_id)
+        return await self.request("GET", Route(f"/guilds/{guild_id}/integrations", guild_id=guild_id))
 
     async def delete_guild_integration(self, guild_id: int, integration_id: int) -> None:
         """Deletes an integration from the guild.
@@ -3223,7 +3462,7 @@ class HTTPClient:
             Route(f"/guilds/{guild_id}/integrations/{integration_id}", guild_id=guild_id),
         )
 
-    async def get_guild_widget_settings(self, guild_id: int) -> dict:
+    def get_guild_widget_settings(self, guild_id: int) -> Awaitable[dict]:
         """Fetches the guild's widget settings.
 
         This method makes an API call to get the widget settings in a guild.
@@ -3243,9 +3482,9 @@ class HTTPClient:
         :class:`dict`
             A dict representing a guild widget object.
         """
-        return await self.request("GET", Route(f"/guilds/{guild_id}/widget"), guild_id=guild_id)
+        return self._get(f"/guilds/{guild_id}/widget", guild_id=guild_id)
 
-    async def get_guild_widget(self, guild_id: int) -> dict:
+    def get_guild_widget(self, guild_id: int) -> Awaitable[dict]:
         """Gets a guild widget for the guild.
 
         This method makes an API call to get the widget in a guild.
@@ -3265,9 +3504,9 @@ class HTTPClient:
         :class:`dict`
             A dict representing a guild widget.
         """
-        return await self.request("GET", Route(f"/guilds/{guild_id}/widget.json"), guild_id=guild_id)
+        return self._get(f"/guilds/{guild_id}/widget.json", guild_id=guild_id)
 
-    async def get_guild_vanity_url(self, guild_id: int) -> dict:
+    def get_guild_vanity_url(self, guild_id: int) -> Awaitable[dict]:
         """Gets a guild's vanity url.
 
         This method makes an API call to get the vanity URL in a guild.
@@ -3287,9 +3526,9 @@ class HTTPClient:
         :class:`dict`
             A dict representing an invite.
         """
-        return await self.request("GET", Route(f"/guilds/{guild_id}/vanity-url"), guild_id=guild_id)
+        return self._get(f"/guilds/{guild_id}/vanity-url", guild_id=guild_id)
 
-    async def get_guild_widget_image(self, guild_id: int, *, style: Optional[str] = None) -> bytes:
+    def get_guild_widget_image(self, guild_id: int, *, style: Optional[str] = None) -> Awaitable[bytes]:
         """Gets a guild's widget image.
 
         This method makes an API call to get the widget image in a guild.
@@ -3304,15 +3543,11 @@ class HTTPClient:
         :class:`bytes`
             A png which is the widget image returned.
         """
-        payload = {"style": style or "shield"}
+        params = {"style": style or "shield"}
 
-        return await self.request(
-            "GET",
-            Route(f"/guilds/{guild_id}/widget.png", guild_id=guild_id),
-            json=payload,
-        )
+        return self._get(f"/guilds/{guild_id}/widget.png", guild_id=guild_id, params=params)
 
-    async def get_guild_welcome_screen(self, guild_id: int) -> dict:
+    def get_guild_welcome_screen(self, guild_id: int) -> Awaitable[dict]:
         """Gets a guild's welcome screen.
 
         This method makes an API call to get the welcome screen in a guild.
@@ -3332,16 +3567,16 @@ class HTTPClient:
         :class:`dict`
             A dict representing a welcome screen object.
         """
-        return await self.request("GET", Route(f"/guilds/{guild_id}/welcome-screen"), guild_id=guild_id)
+        return self._get(f"/guilds/{guild_id}/welcome-screen", guild_id=guild_id)
 
-    async def modify_guild_welcome_screen(
+    def modify_guild_welcome_screen(
         self,
         guild_id: int,
         *,
         enabled: Optional[bool] = None,
         description: Optional[str] = None,
         welcome_channels: Optional[List[int]] = None,
-    ) -> dict:
+    ) -> Awaitable[dict]:
         """Modifies the guild's welcome screen.
 
         This method makes an API call to modify the welcome screen in a guild.
@@ -3370,20 +3605,19 @@ class HTTPClient:
         :class:`dict`
             A dict representing the modified welcome screen object.
         """
-        payload = update_payload(
-            {},
-            enabled=enabled,
-            description=description,
-            welcome_channels=welcome_channels,
-        )
+        payload = {
+            key: value
+            for key, value in (
+                ("enabled", enabled),
+                ("description", description),
+                ("welcome_channels", welcome_channels),
+            )
+            if value is not None
+        }
 
-        return await self.request(
-            "PATCH",
-            Route(f"/guilds/{guild_id}/welcome-screen", guild_id=guild_id),
-            json=payload,
-        )
+        return self._patch(f"/guilds/{guild_id}/welcome-screen", guild_id=guild_id, json=payload)
 
-    async def get_guild_template(self, code: str) -> dict:
+    def get_guild_template(self, code: str) -> Awaitable[dict]:
         """Fetches a guild template.
 
         This method makes an API call to get a guild template.
@@ -3406,15 +3640,15 @@ class HTTPClient:
         :class:`dict`
             A dict representing a guild template object.
         """
-        return await self.request("GET", Route(f"/guilds/templates/{code}"))
+        return self._get(f"/guilds/templates/{code}")
 
-    async def create_guild_from_template(
+    def create_guild_from_template(
         self,
         code: str,
         *,
         name: str,
         icon: Optional[bytes] = None,
-    ) -> dict:
+    ) -> Awaitable[dict]:
         """Creates a guild from a guild template.
 
         This method makes an API call to create a guild from a template.
@@ -3444,14 +3678,14 @@ class HTTPClient:
         :class:`dict`
             A dict representing the newly created guild object.
         """
-        payload = update_payload({}, name=name, icon=icon)
+        if icon is not None:
+            icon = bytes_to_data_uri(icon)  # type: ignore
 
-        if "icon" in payload:
-            payload["icon"] = bytes_to_data_uri(payload["icon"])
+        payload = {key: value for key, value in (("name", name), ("icon", icon)) if value is not None}
 
-        return await self.request("POST", Route(f"/guilds/templates/{code}"), json=payload)
+        return self._post(f"/guilds/templates/{code}", json=payload)
 
-    async def get_guild_templates(self, guild_id: int) -> List[dict]:
+    def get_guild_templates(self, guild_id: int) -> Awaitable[List[dict]]:
         """Fetches a list of the guild's templates.
 
         This method makes an API call to get the templates in a guild.
@@ -3471,15 +3705,15 @@ class HTTPClient:
         List[:class:`dict`]
             A list of dicts representing guild template objects.
         """
-        return await self.request("GET", Route(f"/guilds/{guild_id}/templates", guild_id=guild_id))
+        return self._get(f"/guilds/{guild_id}/templates", guild_id=guild_id)
 
-    async def create_guild_template(
+    def create_guild_template(
         self,
         guild_id: int,
         *,
         name: str,
         description: Optional[str] = None,
-    ) -> dict:
+    ) -> Awaitable[dict]:
         """Makes a guild template object.
 
         This method makes an API call to create a template for a guild.
@@ -3508,15 +3742,13 @@ class HTTPClient:
         :class:`dict`
             A dict representing the newly created guild template object.
         """
-        payload = update_payload({}, name=name, description=description)
+        payload: Dict[str, Any] = {"name": name}
+        if description is not None:
+            payload["description"] = description
 
-        return await self.request(
-            "POST",
-            Route(f"/guilds/{guild_id}/templates", guild_id=guild_id),
-            json=payload,
-        )
+        return self._post(f"/guilds/{guild_id}/templates", guild_id=guild_id, json=payload)
 
-    async def sync_guild_template(self, guild_id: int, code: str) -> dict:
+    def sync_guild_template(self, guild_id: int, code: str) -> Awaitable[dict]:
         """Syncs a template to the guild.
 
         This method makes an API call to sync a template to a guild.
@@ -3542,19 +3774,54 @@ class HTTPClient:
         :class:`dict`
             A dict representing the synced guild template object.
         """
-        return await self.request(
-            "POST",
-            Route(f"/guilds/{guild_id}/templates/{code}/sync", guild_id=guild_id),
-        )
+        return self._post(f"/guilds/{guild_id}/templates/{code}/sync", guild_id=guild_id)
+
+    async def sync_all_templates(self, guild_id: int, codes: List[str], *, concurrency: int = 16) -> List[dict]:
+        """Syncs multiple templates to the guild concurrently.
 
-    async def modify_guild_template(
+        This method calls :meth:`sync_guild_template` for every code, with at most
+        ``concurrency`` requests in flight at once.
+
+        Parameters
+        ----------
+        guild_id: :class:`int`
+            The id of the guild to sync the templates to
+
+        codes: List[:class:`str`]
+            The codes of the templates to sync
+
+        concurrency: :class:`int`
+            The maximum amount of requests to make at once
+
+        Raises
+        ------
+        :exc:`.HTTPException`
+            Something went wrong while making the request.
+
+        :exc:`.Forbidden`
+            Your client doesn't have permissions to do this.
+
+        Returns
+        -------
+        List[:class:`dict`]
+            A list of dicts representing the synced guild template objects, in the order of ``codes``.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def sync(code: str) -> dict:
+            async with semaphore:
+                return await self.sync_guild_template(guild_id, code)
+
+        return await asyncio.gather(*(sync(code) for code in codes))
+
+    def modify_guild_template(
         self,
         guild_id: int,
         code: str,
         *,
         name: Optional[str] = None,
         description: Optional[str] = None,
-    ) -> dict:
+    ) -> Awaitable[dict]:
         """Modifies a guild template object.
 
         This method makes an API call to modify a template for a guild.
@@ -3586,15 +3853,11 @@ class HTTPClient:
         :class:`dict`
             A dict representing the modified guild template object.
         """
-        payload = update_payload({}, name=name, description=description)
+        payload = {key: value for key, value in (("name", name), ("description", description)) if value is not None}
 
-        return await self.request(
-            "PATCH",
-            Route(f"/guilds/{guild_id}/templates/{code}", guild_id=guild_id),
-            json=payload,
-        )
+        return self._patch(f"/guilds/{guild_id}/templates/{code}", guild_id=guild_id, json=payload)
 
-    async def delete_guild_template(self, guild_id: int, code: str) -> dict:
+    def delete_guild_template(self, guild_id: int, code: str) -> Awaitable[dict]:
         """Deletes a guild template.
 
         This method makes an API call to delete a template for a guild.
@@ -3620,9 +3883,9 @@ class HTTPClient:
         :class:`dict`
             A dict representing the deleted guild template object.
         """
-        return await self.request("DELETE", Route(f"/guilds/{guild_id}/templates/{code}", guild_id=guild_id))
+        return self._delete(f"/guilds/{guild_id}/templates/{code}", guild_id=guild_id)
 
-    async def get_invite(self, code: str, *, with_counts: bool = False, with_expiration: bool = False) -> dict:
+    def get_invite(self, code: str, *, with_counts: bool = False, with_expiration: bool = False) -> Awaitable[dict]:
         """Fetches an invite from the guild.
 
         This method makes an API call to get an invite.
@@ -3651,11 +3914,11 @@ class HTTPClient:
         :class:`dict`
             A dict representing the invite object fetched.
         """
-        params = {"with_counts": with_counts, "with_expiration": with_expiration}
+        params = _INVITE_PARAMS[(with_counts, with_expiration)]
 
-        return await self.request("GET", Route(f"/invites/{code}"), params=params)
+        return self._get(f"/invites/{code}", params=params)
 
-    async def delete_invite(self, code: str) -> dict:
+    def delete_invite(self, code: str) -> Awaitable[dict]:
         """Deletes an invite
 
         This method makes an API call to delete an invite.
@@ -3678,9 +3941,15 @@ class HTTPClient:
         :class:`dict`
             A dict representing the deleted invite object.
         """
-        return await self.request("DELETE", Route(f"/invites/{code}"))
+        return self._delete(f"/invites/{code}")
 
-    async def create_stage_instance(self, *, channel_id: int, topic: str, privacy_level: Optional[int] = None) -> dict:
+    def create_stage_instance(
+        self,
+        *,
+        channel_id: int,
+        topic: str,
+        privacy_level: Optional[int] = None,
+    ) -> Awaitable[dict]:
         """Makes a stage instance associated with a stage channel.
 
         This method makes an API call to create a stage instance connected
@@ -3710,11 +3979,13 @@ class HTTPClient:
         :class:`dict`
             A dict representing the newly created stage instance.
         """
-        payload = update_payload({}, channel_id=channel_id, topic=topic, privacy_level=privacy_level)
+        payload: Dict[str, Any] = {"channel_id": channel_id, "topic": topic}
+        if privacy_level is not None:
+            payload["privacy_level"] = privacy_level
 
-        return await self.request("POST", Route("/stage-instances", channel_id=channel_id), json=payload)
+        return self._post("/stage-instances", channel_id=channel_id, json=payload)
 
-    async def get_stage_instance(self, channel_id: int) -> dict:
+    def get_stage_instance(self, channel_id: int) -> Awaitable[dict]:
         """Fetches a stage instance.
 
         This method makes an API call to get a stage instance.
@@ -3734,15 +4005,15 @@ class HTTPClient:
         :class:`dict`
             A dict representing the fetched stage instance object.
         """
-        return await self.request("GET", Route(f"/stage-instances/{channel_id}", channel_id=channel_id))
+        return self._get(f"/stage-instances/{channel_id}", channel_id=channel_id)
 
-    async def modify_stage_instance(
+    def modify_stage_instance(
         self,
         channel_id: int,
         *,
         topic: Optional[str] = None,
         privacy_level: Optional[int] = None,
-    ) -> dict:
+    ) -> Awaitable[dict]:
         """Modifies a stage instance associated with a stage channel.
 
         This method makes an API call to modify a stage instance connected
@@ -3772,15 +4043,18 @@ class HTTPClient:
         :class:`dict`
             A dict representing the modified stage instance.
         """
-        payload = update_payload({}, topic=topic, privacy_level=privacy_level)
+        payload = {
+            key: value
+            for key, value in (
+                ("topic", topic),
+                ("privacy_level", privacy_level),
+            )
+            if value is not None
+        }
 
-        return await self.request(
-            "PATCH",
-            Route(f"/stage-instances/{channel_id}", channel_id=channel_id),
-            json=payload,
-        )
+        return self._patch(f"/stage-instances/{channel_id}", channel_id=channel_id, json=payload)
 
-    async def delete_stage_instance(self, channel_id: int) -> dict:
+    def delete_stage_instance(self, channel_id: int) -> Awaitable[dict]:
         """Deletes a stage instance.
 
         This method makes an API call to delete a stage instance.
@@ -3795,9 +4069,9 @@ class HTTPClient:
         :exc:`.HTTPException`
             Something went wrong while making the request.
         """
-        return await self.request("DELETE", Route(f"/stage-instances/{channel_id}"), channel_id=channel_id)
+        return self._delete(f"/stage-instances/{channel_id}", channel_id=channel_id)
 
-    async def get_sticker(self, sticker_id: int) -> dict:
+    def get_sticker(self, sticker_id: int) -> Awaitable[dict]:
         """Fetch a sticker object.
 
         This method makes an API call to get a sticker.
@@ -3817,9 +4091,9 @@ class HTTPClient:
         :class:`dict`
             A dict representing the fetched sticker object.
         """
-        return await self.request("GET", Route(f"/stickers/{sticker_id}"))
+        return self._get(f"/stickers/{sticker_id}")
 
-    async def list_nitro_sticker_packs(self) -> List[dict]:
+    def list_nitro_sticker_packs(self) -> Awaitable[List[dict]]:
         """Fetches a list of nitro sticker packs.
 
         This method makes an API call to list sticker packs that nitro users can use.
@@ -3834,9 +4108,9 @@ class HTTPClient:
         List[:class:`dict`]
             A list of nitro sticker pack objects
         """
-        return await self.request("GET", Route("/sticker-packs"))
+        return self._get("/sticker-packs")
 
-    async def list_guild_stickers(self, guild_id: int) -> List[dict]:
+    def list_guild_stickers(self, guild_id: int) -> Awaitable[List[dict]]:
         """Fetches a list of guild stickers.
 
         This method makes an API call to list stickers for a guild.
@@ -3856,9 +4130,9 @@ class HTTPClient:
         List[:class:`dict`]
             A list of dicts representing guild stickers.
         """
-        return await self.request("GET", Route(f"/guilds/{guild_id}/stickers", guild_id=guild_id))
+        return self._get(f"/guilds/{guild_id}/stickers", guild_id=guild_id)
 
-    async def get_guild_sticker(self, guild_id: int, sticker_id: int) -> dict:
+    def get_guild_sticker(self, guild_id: int, sticker_id: int) -> Awaitable[dict]:
         """Fetches a guild sticker
 
         This method makes an API call to get a sticker for a guild.
@@ -3881,9 +4155,9 @@ class HTTPClient:
         :class:`dict`
             A dict representing the fetched sticker object.
         """
-        return await self.request("GET", Route(f"/guilds/{guild_id}/stickers/{sticker_id}", guild_id=guild_id))
+        return self._get(f"/guilds/{guild_id}/stickers/{sticker_id}", guild_id=guild_id)
 
-    async def modify_guild_sticker(
+    def modify_guild_sticker(
         self,
         guild_id: int,
         sticker_id: int,
@@ -3891,7 +4165,7 @@ class HTTPClient:
         name: Optional[str] = None,
         description: Optional[str] = None,
         tags: Optional[str] = None,
-    ) -> dict:
+    ) -> Awaitable[dict]:
         """Modifies a guild sticker.
 
         This method makes an API call to modify a sticker for a guild.
@@ -3926,15 +4200,19 @@ class HTTPClient:
         :class:`dict`
             A dict representing the modified sticker object.
         """
-        payload = update_payload({}, name=name, description=description, tags=tags)
+        payload = {
+            key: value
+            for key, value in (
+                ("name", name),
+                ("description", description),
+                ("tags", tags),
+            )
+            if value is not None
+        }
 
-        return await self.request(
-            "PATCH",
-            Route(f"/guilds/{guild_id}/stickers/{sticker_id}", guild_id=guild_id),
-            json=payload,
-        )
+        return self._patch(f"/guilds/{guild_id}/stickers/{sticker_id}", guild_id=guild_id, json=payload)
 
-    async def delete_guild_sticker(self, guild_id: int, sticker_id: int) -> None:
+    def delete_guild_sticker(self, guild_id: int, sticker_id: int) -> Awaitable[None]:
         """Deletes a guild sticker.
 
         This method makes an API call to delete a sticker for a guild.
@@ -3955,12 +4233,9 @@ class HTTPClient:
         :exc:`.Forbidden`
             Your client doesn't have permissions to delete this sticker.
         """
-        return await self.request(
-            "DELETE",
-            Route(f"/guilds/{guild_id}/stickers/{sticker_id}", guild_id=guild_id),
-        )
+        return self._delete(f"/guilds/{guild_id}/stickers/{sticker_id}", guild_id=guild_id)
 
-    async def get_user(self, user_id: int) -> dict:
+    def get_user(self, user_id: int) -> Awaitable[dict]:
         """Fetches a user.
 
         This method makes an API call to fetch a user.
@@ -3980,9 +4255,9 @@ class HTTPClient:
         :class:`dict`
             A dict representing the fetched user object.
         """
-        return await self.request("GET", Route(f"/users/{user_id}"))
+        return self._get(f"/users/{user_id}")
 
-    async def get_current_user(self) -> dict:
+    def get_current_user(self) -> Awaitable[dict]:
         """Fetches the current authorized user.
 
         This method makes an API call to get the current user.
@@ -3997,9 +4272,9 @@ class HTTPClient:
         :class:`dict`
             A dict representing the user object of the current user.
         """
-        return await self.request("GET", Route("/users/@me"))
+        return self._get("/users/@me")
 
-    async def modify_current_user(self, *, username: Optional[str] = None, avatar: Optional[bytes] = None) -> dict:
+    def modify_current_user(self, *, username: Optional[str] = None, avatar: Optional[bytes] = None) -> Awaitable[dict]:
         """Modifies the current authorized user.
 
         This method makes an API call to modify the current user.
@@ -4025,14 +4300,14 @@ class HTTPClient:
         :class:`dict`
             A dict representing the modified user object.
         """
-        payload = update_payload({}, username=username, avatar=avatar)
+        if avatar is not None:
+            avatar = bytes_to_data_uri(avatar)  # type: ignore
 
-        if "avatar" in payload:
-            payload["avatar"] = bytes_to_data_uri(payload["avatar"])
+        payload = {key: value for key, value in (("username", username), ("avatar", avatar)) if value is not None}
 
-        return await self.request("PATCH", Route("/users/@me"), json=payload)
+        return self._patch("/users/@me", json=payload)
 
-    async def get_current_user_guilds(self) -> List[dict]:
+    def get_current_user_guilds(self) -> Awaitable[List[dict]]:
         """Fetches all guilds that the current user is in.
 
         This method makes an API call to get the current user's guilds.
@@ -4047,7 +4322,7 @@ class HTTPClient:
         List[:class:`dict`]
             A list of dicts that represent guild objects.
         """
-        return await self.request("GET", Route("/users/@me/guilds"))
+        return self._get("/users/@me/guilds")
 
     async def leave_guild(self, guild_id: int) -> None:
         """Leaves a guild.
@@ -4067,9 +4342,9 @@ class HTTPClient:
         :exc:`.NotFound`
             The guild id was invalid.
         """
-        await self.request("DELETE", Route(f"/users/@me/guilds/{guild_id}", guild_id=guild_id))
+        await self._delete(f"/users/@me/guilds/{guild_id}", guild_id=guild_id)
 
-    async def create_dm_channel(self, recipient_id: int) -> dict:
+    def create_dm_channel(self, recipient_id: int) -> Awaitable[dict]:
         """Creates a DM channel to a user.
 
         This method makes an API call which creates a DM channel to a user.
@@ -4096,9 +4371,9 @@ class HTTPClient:
             A dict representing the created DM channel object.
         """
         payload = {"recipient_id": recipient_id}
-        return await self.request("POST", Route("/users/@me/channels"), json=payload)
+        return self._post("/users/@me/channels", json=payload)
 
-    async def list_voice_regions(self) -> List[dict]:
+    def list_voice_regions(self) -> Awaitable[List[dict]]:
         """Fetches voice regions.
 
         This method makes an API call to list voice regions.
@@ -4113,15 +4388,15 @@ class HTTPClient:
         List[:class:`dict`]
             A list of dicts representing voice region objects
         """
-        return await self.request("GET", Route("/voice/regions"))
+        return self._get("/voice/regions")
 
-    async def create_webhook(
+    def create_webhook(
         self,
         channel_id: int,
         *,
         name: str,
         avatar: Optional[bytes] = None,
-    ) -> dict:
+    ) -> Awaitable[dict]:
         """Creates a webhook.
 
         This method makes an API call to create a webhook.
@@ -4152,13 +4427,9 @@ class HTTPClient:
             "avatar": bytes_to_data_uri(avatar) if avatar else None,
         }
 
-        return await self.request(
-            "POST",
-            Route(f"/channels/{channel_id}/webhooks", channel_id=channel_id),
-            json=payload,
-        )
+        return self._post(f"/channels/{channel_id}/webhooks", channel_id=channel_id, json=payload)
 
-    async def get_channel_webhooks(self, channel_id: int) -> List[dict]:
+    def get_channel_webhooks(self, channel_id: int) -> Awaitable[List[dict]]:
         """Fetches the webhook of a channel.
 
         This method makes an API call to get the webhooks for a channel.
@@ -4178,9 +4449,9 @@ class HTTPClient:
         List[:class:`dict`]
             A list of dicts representing webhook objects
         """
-        return await self.request("GET", Route(f"/channels/{channel_id}/webhooks", channel_id=channel_id))
+        return self._get(f"/channels/{channel_id}/webhooks", channel_id=channel_id)
 
-    async def get_guild_webhooks(self, guild_id: int) -> List[dict]:
+    def get_guild_webhooks(self, guild_id: int) -> Awaitable[List[dict]]:
         """Fetches all webhooks of a guild.
 
         This method makes an API call to get the webhooks for a guild.
@@ -4200,9 +4471,9 @@ class HTTPClient:
         List[:class:`dict`]
             A list of dicts representing webhook objects
         """
-        return await self.request("GET", Route(f"/guilds/{guild_id}/webhooks", guild_id=guild_id))
+        return self._get(f"/guilds/{guild_id}/webhooks", guild_id=guild_id)
 
-    async def get_webhook(self, webhook_id: int) -> dict:
+    def get_webhook(self, webhook_id: int) -> Awaitable[dict]:
         """Fetches a webhook.
 
         This method makes an API call to get a webhook.
@@ -4222,9 +4493,9 @@ class HTTPClient:
         :class:`dict`
             A dict representing the fetched webhook object.
         """
-        return await self.request("GET", Route(f"/webhooks/{webhook_id}", webhook_id=webhook_id))
+        return self._get(f"/webhooks/{webhook_id}", webhook_id=webhook_id)
 
-    async def get_webhook_with_token(self, webhook_id: int, webhook_token: str) -> dict:
+    def get_webhook_with_token(self, webhook_id: int, webhook_token: str) -> Awaitable[dict]:
         """Fetches a webhook without needing authorization.
 
         This method makes an API call to get a webhook.
@@ -4247,23 +4518,20 @@ class HTTPClient:
         :class:`dict`
             A dict representing the fetched webhook object.
         """
-        return await self.request(
-            "GET",
-            Route(
-                f"/webhooks/{webhook_id}/{webhook_token}",
-                webhook_id=webhook_id,
-                webhookd_token=webhook_token,
-            ),
+        return self._get(
+            f"/webhooks/{webhook_id}/{webhook_token}",
+            webhook_id=webhook_id,
+            webhook_token=webhook_token,
         )
 
-    async def modify_webhook(
+    def modify_webhook(
         self,
         webhook_id: int,
         *,
         name: Optional[str] = None,
         avatar: Optional[bytes] = None,
         channel_id: Optional[int] = None,
-    ) -> dict:
+    ) -> Awaitable[dict]:
         """Modifies a webhook.
 
         This method makes an API call to create a webhook.
@@ -4292,16 +4560,20 @@ class HTTPClient:
         :class:`dict`
             A dict representing the modified webhook object.
         """
-        payload = update_payload({}, name=name, avatar=avatar, channel_id=channel_id)
+        if avatar is not None:
+            avatar = bytes_to_data_uri(avatar)  # type: ignore
 
-        if "avatar" in payload:
-            payload["avatar"] = bytes_to_data_uri(payload["avatar"])
+        payload = {
+            key: value
+            for key, value in (
+                ("name", name),
+                ("avatar", avatar),
+                ("channel_id", channel_id),
+            )
+            if value is not None
+        }
 
-        return await self.request(
-            "PATCH",
-            Route(f"/webhooks/{webhook_id}", webhook_id=webhook_id),
-            json=payload,
-        )
+        return self._patch(f"/webhooks/{webhook_id}", webhook_id=webhook_id, json=payload)
 
     async def modify_webhook_with_token(
         self,
@@ -4339,22 +4611,15 @@ class HTTPClient:
         :class:`dict`
             A dict representing the modified webhook object.
         """
-        payload = update_payload(
-            {},
-            name=name,
-            avatar=avatar,
-        )
+        if avatar is not None:
+            avatar = bytes_to_data_uri(avatar)  # type: ignore
 
-        if "avatar" in payload:
-            payload["avatar"] = bytes_to_data_uri(payload["avatar"])
+        payload = {key: value for key, value in (("name", name), ("avatar", avatar)) if value is not None}
 
-        await self.request(
-            "PATCH",
-            Route(
-                f"/webhooks/{webhook_id}/{webhook_token}",
-                webhook_id=webhook_id,
-                webhook_token=webhook_token,
-            ),
+        await self._patch(
+            f"/webhooks/{webhook_id}/{webhook_token}",
+            webhook_id=webhook_id,
+            webhook_token=webhook_token,
             json=payload,
         )
 
@@ -4376,7 +4641,7 @@ class HTTPClient:
         :exc:`.Forbidden`
             Your client doesn't have permissions to delete this webhook.
         """
-        await self.request("DELETE", Route(f"/webhooks/{webhook_id}", webhook_id=webhook_id))
+        await self._delete(f"/webhooks/{webhook_id}", webhook_id=webhook_id)
 
     async def delete_webhook_with_token(self, webhook_id: int, webhook_token: str) -> None:
         """Deletes a webhook with token.
@@ -4399,16 +4664,13 @@ class HTTPClient:
         :exc:`.Forbidden`
             Your client doesn't have permissions to delete this webhook.
         """
-        await self.request(
-            "DELETE",
-            Route(
-                f"/webhooks/{webhook_id}/{webhook_token}",
-                webhook_id=webhook_id,
-                webhook_token=webhook_token,
-            ),
+        await self._delete(
+            f"/webhooks/{webhook_id}/{webhook_token}",
+            webhook_id=webhook_id,
+            webhook_token=webhook_token,
         )
 
-    async def execute_webhook(
+    def execute_webhook(
         self,
         webhook_id: int,
         webhook_token: str,
@@ -4423,7 +4685,7 @@ class HTTPClient:
         componenets: Optional[List[dict]] = None,
         wait: Optional[bool] = None,
         thread_id: Optional[int] = None,
-    ) -> None:
+    ) -> Awaitable[Optional[dict]]:
         """Executes a webhook.
 
         This method makes an API call to execute a webhook.
@@ -4474,34 +4736,103 @@ class HTTPClient:
 
         :exc:`.BadRequest`
             You somehow messed up the payload.
+
+        Returns
+        -------
+        Optional[:class:`dict`]
+            A dict representing the sent message if ``wait`` is ``True``.
         """
-        form = self.form_helper([file])
-        payload = update_payload(
-            {},
-            content=content,
-            username=username,
-            avatar_url=avatar_url,
-            tts=tts,
-            embeds=embeds,
-            allowed_mentions=allowed_mentions,
-            componenets=componenets,
-        )
+        form = self.form_helper([file]) if file is not None else None
+        payload = {
+            key: value
+            for key, value in (
+                ("content", content),
+                ("username", username),
+                ("avatar_url", avatar_url),
+                ("tts", tts),
+                ("embeds", embeds),
+                ("allowed_mentions", allowed_mentions),
+                ("components", componenets),
+            )
+            if value is not None
+        }
 
-        params = update_payload({}, wait=wait, thread_id=thread_id)
+        params = {key: value for key, value in (("wait", wait), ("thread_id", thread_id)) if value is not None}
 
-        return await self.request(
-            "POST",
-            Route(
-                f"/webhooks/{webhook_id}/{webhook_token}",
-                webhook_id=webhook_id,
-                webhook_token=webhook_token,
-            ),
+        return self._post(
+            f"/webhooks/{webhook_id}/{webhook_token}",
+            webhook_id=webhook_id,
+            webhook_token=webhook_token,
             json=payload,
             form=form,
             params=params,
         )
 
-    async def get_webhook_message(self, webhook_id: int, webhook_token: str, message_id: int) -> dict:
+    async def execute_webhook_batch(self, messages: List[Dict[str, Any]]) -> List[Any]:
+        """Executes a webhook for multiple messages, coalescing embed-only messages.
+
+        This method takes a list of keyword arguments for :meth:`execute_webhook`.
+        Consecutive messages which only carry embeds and target the same webhook
+        with the same options are merged into a single request carrying up to 10 embeds,
+        as long as the embeds' text stays within the 6000 character limit of a message.
+        Every other message is sent on its own.
+
+        Parameters
+        ----------
+        messages: List[:class:`dict`]
+            A list of dicts, each one being the keyword arguments to pass to :meth:`execute_webhook`.
+            Every dict must contain ``webhook_id`` and ``webhook_token``.
+
+        Raises
+        ------
+        :exc:`.HTTPException`
+            Something went wrong while making the request.
+
+        :exc:`.BadRequest`
+            You somehow messed up the payload.
+
+        Returns
+        -------
+        List[Any]
+            The return data of every request made, in order.
+        """
+        batches: List[Dict[str, Any]] = []
+        # The combined embed text length of each batch, or None if other messages can't be merged into it.
+        lengths: List[Optional[int]] = []
+        mergeable = ("webhook_id", "webhook_token", "embeds", "username", "avatar_url", "wait", "thread_id")
+
+        for message in messages:
+            embeds = message.get("embeds")
+            if not embeds or not all(key in mergeable for key in message):
+                batches.append(message)
+                lengths.append(None)
+                continue
+
+            length = sum(map(_embed_length, embeds))
+            last_length = lengths[-1] if lengths else None
+
+            if last_length is not None:
+                last = batches[-1]
+
+                if (
+                    all(last.get(key) == message.get(key) for key in mergeable if key != "embeds")
+                    and len(last["embeds"]) + len(embeds) <= 10
+                    and last_length + length <= 6000
+                ):
+                    last["embeds"].extend(embeds)
+                    lengths[-1] = last_length + length
+                    continue
+
+            batches.append({**message, "embeds": list(embeds)})
+            lengths.append(length)
+
+        results: List[Any] = []
+        for batch in batches:
+            results.append(await self.execute_webhook(**batch))
+
+        return results
+
+    def get_webhook_message(self, webhook_id: int, webhook_token: str, message_id: int) -> Awaitable[dict]:
         """Fetches a webhook message.
 
         This method makes an API call to get a webhook message.
@@ -4527,16 +4858,13 @@ class HTTPClient:
         :class:`dict`
             A dict representing the fetched message
         """
-        return await self.request(
-            "GET",
-            Route(
-                f"/webhooks/{webhook_id}/{webhook_token}/messages/{message_id}",
-                webhook_id=webhook_id,
-                webhook_token=webhook_token,
-            ),
+        return self._get(
+            f"/webhooks/{webhook_id}/{webhook_token}/messages/{message_id}",
+            webhook_id=webhook_id,
+            webhook_token=webhook_token,
         )
 
-    async def edit_webhook_message(
+    def edit_webhook_message(
         self,
         webhook_id: int,
         webhook_token: str,
@@ -4548,7 +4876,7 @@ class HTTPClient:
         allowed_mentions: Optional[Dict[str, Any]] = None,
         componenets: Optional[List[Dict[str, Any]]] = None,
         attachments: Optional[List[Dict[str, Any]]] = None,
-    ) -> dict:
+    ) -> Awaitable[dict]:
         """Executes a webhook.
 
         This method makes an API call to execute a webhook.
@@ -4592,28 +4920,28 @@ class HTTPClient:
         :class:`dict`
             A dict representing the modified message.
         """
-        form = self.form_helper([file])
-        payload = update_payload(
-            {},
-            content=content,
-            embeds=embeds,
-            allowed_mentions=allowed_mentions,
-            componenets=componenets,
-            attachments=attachments,
-        )
+        form = self.form_helper([file]) if file is not None else None
+        payload = {
+            key: value
+            for key, value in (
+                ("content", content),
+                ("embeds", embeds),
+                ("allowed_mentions", allowed_mentions),
+                ("components", componenets),
+                ("attachments", attachments),
+            )
+            if value is not None
+        }
 
-        return await self.request(
-            "PATCH",
-            Route(
-                f"/webhooks/{webhook_id}/{webhook_token}/messages/{message_id}",
-                webhook_id=webhook_id,
-                webhook_token=webhook_token,
-            ),
+        return self._patch(
+            f"/webhooks/{webhook_id}/{webhook_token}/messages/{message_id}",
+            webhook_id=webhook_id,
+            webhook_token=webhook_token,
             json=payload,
             form=form,
         )
 
-    async def delete_webhook_message(self, webhook_id: int, webhook_token: str, message_id: int) -> None:
+    def delete_webhook_message(self, webhook_id: int, webhook_token: str, message_id: int) -> Awaitable[None]:
         """Deletes a webhook message.
 
         This method makes an API call to delete a webhook message.
@@ -4634,16 +4962,13 @@ class HTTPClient:
         :exc:`.HTTPException`
             Something went wrong while making the request.
         """
-        return await self.request(
-            "DELETE",
-            Route(
-                f"/webhooks/{webhook_id}/{webhook_token}/messages/{message_id}",
-                webhook_id=webhook_id,
-                webhook_token=webhook_token,
-            ),
+        return self._delete(
+            f"/webhooks/{webhook_id}/{webhook_token}/messages/{message_id}",
+            webhook_id=webhook_id,
+            webhook_token=webhook_token,
         )
 
-    async def get_global_application_commands(self, application_id: int) -> List[dict]:
+    def get_global_application_commands(self, application_id: int) -> Awaitable[List[dict]]:
         """Fetches all global application commands.
 
         This method does an API call to fetch a list of all
@@ -4664,9 +4989,9 @@ class HTTPClient:
         List[:class:`dict`]
             A list of global application command objects
         """
-        return await self.request("GET", Route(f"/applications/{application_id}/commands"))
+        return self.request(_GET, _command_route(_GLOBAL_COMMANDS, application_id))
 
-    async def create_global_application_command(
+    def create_global_application_command(
         self,
         application_id: int,
         *,
@@ -4675,7 +5000,7 @@ class HTTPClient:
         options: Optional[List[dict]] = None,
         default_permission: bool = True,
         type: int = 1,
-    ) -> dict:
+    ) -> Awaitable[dict]:
         """Creates a global application command.
 
         This method makes an API call to create a global application command.
@@ -4718,18 +5043,21 @@ class HTTPClient:
         :class:`dict`
             A dict representing the newly created application command.
         """
-        payload = update_payload(
-            {},
-            name=name,
-            description=description,
-            options=options,
-            default_permission=default_permission,
-            type=type,
-        )
+        payload = {
+            key: value
+            for key, value in (
+                ("name", name),
+                ("description", description),
+                ("options", options),
+                ("default_permission", default_permission),
+                ("type", type),
+            )
+            if value is not None
+        }
 
-        return await self.request("POST", Route(f"/applications/{application_id}/commands"), json=payload)
+        return self.request(_POST, _command_route(_GLOBAL_COMMANDS, application_id), json=payload)
 
-    async def get_global_application_command(self, application_id: int, command_id: int) -> dict:
+    def get_global_application_command(self, application_id: int, command_id: int) -> Awaitable[dict]:
         """Fetches a global application command.
 
         This method makes an API call to get a global application command.
@@ -4752,9 +5080,9 @@ class HTTPClient:
         :class:`dict`
             A dict representing the fetched global application command.
         """
-        return await self.request("GET", Route(f"/applications/{application_id}/commands/{command_id}"))
+        return self.request(_GET, _command_route(_GLOBAL_COMMAND, application_id, command_id=command_id))
 
-    async def edit_global_application_command(
+    def edit_global_application_command(
         self,
         application_id: int,
         command_id: int,
@@ -4763,7 +5091,7 @@ class HTTPClient:
         description: Optional[str] = None,
         options: Optional[List[dict]] = None,
         default_permission: Optional[bool] = None,
-    ) -> dict:
+    ) -> Awaitable[dict]:
         """Modifies a global application command.
 
         This method makes an API call to modify a global application command.
@@ -4806,21 +5134,24 @@ class HTTPClient:
         :class:`dict`
             A dict representing the modified application command.
         """
-        payload = update_payload(
-            {},
-            name=name,
-            description=description,
-            options=options,
-            default_permission=default_permission,
-        )
+        payload = {
+            key: value
+            for key, value in (
+                ("name", name),
+                ("description", description),
+                ("options", options),
+                ("default_permission", default_permission),
+            )
+            if value is not None
+        }
 
-        return await self.request(
-            "PATCH",
-            Route(f"/applications/{application_id}/commands/{command_id}"),
+        return self.request(
+            _PATCH,
+            _command_route(_GLOBAL_COMMAND, application_id, command_id=command_id),
             json=payload,
         )
 
-    async def delete_global_application_command(self, application_id: int, command_id: int) -> None:
+    def delete_global_application_command(self, application_id: int, command_id: int) -> Awaitable[None]:
         """Deletes a global application command.
 
         This method makes an API call to delete a global application command.
@@ -4838,11 +5169,11 @@ class HTTPClient:
         :exc:`.HTTPException`
             Something went wrong while making the request.
         """
-        await self.request("DELETE", Route(f"/applications/{application_id}/commands/{command_id}"))
+        return self.request(_DELETE, _command_route(_GLOBAL_COMMAND, application_id, command_id=command_id))
 
-    async def bulk_overwrite_global_application_commands(
+    def bulk_overwrite_global_application_commands(
         self, application_id: int, *, commands: List[dict]
-    ) -> List[dict]:
+    ) -> Awaitable[List[dict]]:
         """Bulk overwrites the current global application commands.
 
         This method makes an API call to bulk overwrite global application commands.
@@ -4869,9 +5200,9 @@ class HTTPClient:
         List[:class:`dict`]
             A list of dicts representing application commands.
         """
-        return await self.request("PUT", Route(f"/applications/{application_id}/commands"), json=commands)
+        return self.request(_PUT, _command_route(_GLOBAL_COMMANDS, application_id), json=commands)
 
-    async def get_guild_application_commands(self, application_id: int, guild_id: int) -> List[dict]:
+    def get_guild_application_commands(self, application_id: int, guild_id: int) -> Awaitable[List[dict]]:
         """Fetches a list of application commands from a guild.
 
         This method makes an API call to get guild application commands.
@@ -4894,15 +5225,9 @@ class HTTPClient:
         List[:class:`dict`]
             A list of dicts representing application command objects.
         """
-        return await self.request(
-            "GET",
-            Route(
-                f"/applications/{application_id}/guilds/{guild_id}/commands",
-                guild_id=guild_id,
-            ),
-        )
+        return self.request(_GET, _command_route(_GUILD_COMMANDS, application_id, guild_id))
 
-    async def create_guild_application_command(
+    def create_guild_application_command(
         self,
         application_id: int,
         guild_id: int,
@@ -4912,7 +5237,7 @@ class HTTPClient:
         options: Optional[List[dict]] = None,
         default_permission: bool = True,
         type: int = 1,
-    ) -> dict:
+    ) -> Awaitable[dict]:
         """Creates an application command for a guild.
 
         This method makes an API call to create a guild application command.
@@ -4953,25 +5278,21 @@ class HTTPClient:
         :class:`dict`
             A dict representing the created application command.
         """
-        payload = update_payload(
-            {},
-            name=name,
-            description=description,
-            options=options,
-            default_permission=default_permission,
-            type=type,
-        )
+        payload = {
+            key: value
+            for key, value in (
+                ("name", name),
+                ("description", description),
+                ("options", options),
+                ("default_permission", default_permission),
+                ("type", type),
+            )
+            if value is not None
+        }
 
-        return await self.request(
-            "POST",
-            Route(
-                f"/applications/{application_id}/guilds/{guild_id}/commands",
-                guild_id=guild_id,
-            ),
-            json=payload,
-        )
+        return self.request(_POST, _command_route(_GUILD_COMMANDS, application_id, guild_id), json=payload)
 
-    async def get_guild_application_command(self, application_id: int, guild_id: int, command_id: int) -> dict:
+    def get_guild_application_command(self, application_id: int, guild_id: int, command_id: int) -> Awaitable[dict]:
         """Fetches a guild's application command.
 
         This method makes an API call to get a guild application command.
@@ -4997,15 +5318,9 @@ class HTTPClient:
         :class:`dict`
             A dict representing the fetched application command.
         """
-        return await self.request(
-            "GET",
-            Route(
-                f"/applications/{application_id}/guilds/{guild_id}/commands/{command_id}",
-                guild_id=guild_id,
-            ),
-        )
+        return self.request(_GET, _command_route(_GUILD_COMMAND, application_id, guild_id, command_id))
 
-    async def edit_guild_application_command(
+    def edit_guild_application_command(
         self,
         application_id: int,
         guild_id: int,
@@ -5015,7 +5330,7 @@ class HTTPClient:
         description: Optional[str] = None,
         options: Optional[List[Dict[str, Any]]] = None,
         default_permission: Optional[bool] = None,
-    ) -> dict:
+    ) -> Awaitable[dict]:
         """Modifies a guild's application command.
 
         This method makes an API call to edit a guild application command.
@@ -5056,24 +5371,20 @@ class HTTPClient:
         :class:`dict`
             A dict representing the modified application command.
         """
-        payload = update_payload(
-            {},
-            name=name,
-            description=description,
-            options=options,
-            default_permission=default_permission,
-        )
+        payload = {
+            key: value
+            for key, value in (
+                ("name", name),
+                ("description", description),
+                ("options", options),
+                ("default_permission", default_permission),
+            )
+            if value is not None
+        }
 
-        return await self.request(
-            "PATCH",
-            Route(
-                f"/applications/{application_id}/guilds/{guild_id}/commands/{command_id}",
-                guild_id=guild_id,
-            ),
-            json=payload,
-        )
+        return self.request(_PATCH, _command_route(_GUILD_COMMAND, application_id, guild_id, command_id), json=payload)
 
-    async def delete_guild_application_command(self, application_id: int, guild_id: int, command_id: int) -> None:
+    def delete_guild_application_command(self, application_id: int, guild_id: int, command_id: int) -> Awaitable[None]:
         """Deletes a guild's application command.
 
         This method makes an API call to delete a guild's
@@ -5095,17 +5406,11 @@ class HTTPClient:
         :exc:`.HTTPException`
             Something went wrong while making the request.
         """
-        await self.request(
-            "DELETE",
-            Route(
-                f"/applications/{application_id}/guilds/{guild_id}/commands/{command_id}",
-                guild_id=guild_id,
-            ),
-        )
+        return self.request(_DELETE, _command_route(_GUILD_COMMAND, application_id, guild_id, command_id))
 
-    async def bulk_overwrite_guild_application_commands(
+    def bulk_overwrite_guild_application_commands(
         self, application_id: int, guild_id: int, *, commands: List[dict]
-    ) -> List[dict]:
+    ) -> Awaitable[List[dict]]:
         """Bulk overwrite guild application commands.
 
         Makes an API call to bulk overwrite guild application commands.
@@ -5131,16 +5436,103 @@ class HTTPClient:
         List[:class:`dict`]
             A list of dicts representing application commands.
         """
-        return await self.request(
-            "PUT",
-            Route(
-                f"/applications/{application_id}/guilds/{guild_id}/commands",
-                guild_id=guild_id,
-            ),
-            json=commands,
-        )
+        return self.request(_PUT, _command_route(_GUILD_COMMANDS, application_id, guild_id), json=commands)
 
-    async def get_guild_application_command_permissions(self, application_id: int, guild_id: int) -> List[dict]:
+    def queue_guild_application_command(
+        self,
+        guild_id: int,
+        *,
+        name: str,
+        description: str,
+        options: Optional[List[dict]] = None,
+        default_permission: bool = True,
+        type: int = 1,
+    ) -> None:
+        """Queues an application command to be created in a guild.
+
+        Queued commands are all sent in a single request by
+        :meth:`flush_guild_application_commands`, instead of making
+        a request per command with :meth:`create_guild_application_command`.
+
+        Parameters
+        ----------
+        guild_id: :class:`int`
+            The id of the guild where the command will be added
+
+        name: :class:`str`
+            The name of the command
+
+        description: :class:`str`
+            The description of the command
+
+        options: Optional[List[:class:`dict`]]
+            The options of the application command
+
+        default_permission: :class:`bool`
+            If the application command should be enabled on guild add
+
+        type: :class:`int`
+            The application command type
+        """
+        payload = {
+            key: value
+            for key, value in (
+                ("name", name),
+                ("description", description),
+                ("options", options),
+                ("default_permission", default_permission),
+                ("type", type),
+            )
+            if value is not None
+        }
+
+        self.pending_guild_commands.setdefault(guild_id, []).append(payload)
+
+    async def flush_guild_application_commands(self, application_id: int, guild_id: int) -> List[dict]:
+        """Sends the application commands queued for a guild.
+
+        This method makes a single API call with every command queued by
+        :meth:`queue_guild_application_command`. If nothing is queued for
+        the guild no request is made, and if the request fails the commands
+        stay queued.
+
+        .. warning::
+
+            This uses :meth:`bulk_overwrite_guild_application_commands`, so any existing
+            guild commands which weren't queued are removed.
+
+        Parameters
+        ----------
+        application_id: :class:`int`
+            The client's application id
+
+        guild_id: :class:`int`
+            The id of the guild to send the commands to
+
+        Raises
+        ------
+        :exc:`.HTTPException`
+            Something went wrong while making the request.
+
+        Returns
+        -------
+        List[:class:`dict`]
+            A list of dicts representing the guild's application commands,
+            or an empty list if nothing was queued.
+        """
+        # An empty bulk overwrite would delete every command in the guild.
+        commands = self.pending_guild_commands.pop(guild_id, None)
+        if not commands:
+            return []
+
+        try:
+            return await self.bulk_overwrite_guild_application_commands(application_id, guild_id, commands=commands)
+        except BaseException:
+            # Anything queued while the request was in flight goes after the commands that failed.
+            self.pending_guild_commands[guild_id] = commands + self.pending_guild_commands.get(guild_id, [])
+            raise
+
+    def get_guild_application_command_permissions(self, application_id: int, guild_id: int) -> Awaitable[List[dict]]:
         """Fetches a list of guild application command permissions objects.
 
         This method makes an API call to get guild application command permissions.
@@ -5163,15 +5555,11 @@ class HTTPClient:
         List[:class:`dict`]
             A list of dicts representing guild application command permissions objects.
         """
-        return await self.request(
-            "GET",
-            Route(
-                f"/applications/{application_id}/guilds/{guild_id}/commands/permissions",
-                guild_id=guild_id,
-            ),
-        )
+        return self.request(_GET, _command_route(_GUILD_COMMANDS_PERMISSIONS, application_id, guild_id))
 
-    async def get_application_command_permissions(self, application_id: int, guild_id: int, command_id: int) -> dict:
+    def get_application_command_permissions(
+        self, application_id: int, guild_id: int, command_id: int
+    ) -> Awaitable[dict]:
         """Fetches a specific application command's permissions.
 
         This method makes an API call to get an application command permissions.
@@ -5197,22 +5585,16 @@ class HTTPClient:
         :class:`dict`
             A dict representing an application command's permissions.
         """
-        return await self.request(
-            "GET",
-            Route(
-                f"/applications/{application_id}/guilds/{guild_id}/commands/{command_id}/permissions",
-                guild_id=guild_id,
-            ),
-        )
+        return self.request(_GET, _command_route(_GUILD_COMMAND_PERMISSIONS, application_id, guild_id, command_id))
 
-    async def edit_application_command_permissions(
+    def edit_application_command_permissions(
         self,
         application_id: int,
         guild_id: int,
         command_id: int,
         *,
         permissions: List[dict],
-    ) -> dict:
+    ) -> Awaitable[dict]:
         """Edits a specific application command's permissions.
 
         This method makes an API call to edit application command permissions.
@@ -5246,18 +5628,15 @@ class HTTPClient:
             A dict representing an application command's permissions.
         """
         payload = {"permissions": permissions}
-        return await self.request(
-            "PATCH",
-            Route(
-                f"/applications/{application_id}/guilds/{guild_id}/commands/{command_id}/permissions",
-                guild_id=guild_id,
-            ),
+        return self.request(
+            _PATCH,
+            _command_route(_GUILD_COMMAND_PERMISSIONS, application_id, guild_id, command_id),
             json=payload,
         )
 
-    async def batch_edit_application_command_permissions(
+    def batch_edit_application_command_permissions(
         self, application_id: int, guild_id: int, *, permissions: List[dict]
-    ) -> List[dict]:
+    ) -> Awaitable[List[dict]]:
         """Batch edit guild application commands permissions.
 
         This method makes an API call to edit all guild application commands permissions.
@@ -5287,12 +5666,9 @@ class HTTPClient:
         List[:class:`dict`]
             A list of dicts representing an application command's permissions.
         """
-        return await self.request(
-            "PATCH",
-            Route(
-                f"/applications/{application_id}/guilds/{guild_id}/commands/permissions",
-                guild_id=guild_id,
-            ),
+        return self.request(
+            _PATCH,
+            _command_route(_GUILD_COMMANDS_PERMISSIONS, application_id, guild_id),
             json=permissions,
         )
 
@@ -5335,7 +5711,7 @@ class HTTPClient:
         :class:`dict`
             A dict representing the interaction response created.
         """
-        payload = update_payload({}, type=type, data=data)
+        payload = {key: value for key, value in (("type", type), ("data", data)) if value is not None}
         return await self.request(
             "POST",
             Route(f"/interactions/{interaction_id}/{interaction_token}/callback"),
@@ -5368,7 +5744,7 @@ class HTTPClient:
         """
         return await self.request(
             "GET",
-            Route(f"/webhooks/{application_id}/{interaction_token}/messages/@original"),
+            Route(_interaction_messages(application_id, interaction_token) + "/@original"),
         )
 
     async def edit_original_interaction_response(
@@ -5426,19 +5802,22 @@ class HTTPClient:
         :class:`dict`
             A dict representing the updated response.
         """
-        form = self.form_helper([file])
-        payload = update_payload(
-            {},
-            content=content,
-            embeds=embeds,
-            allowed_mentions=allowed_mentions,
-            componenets=componenets,
-            attachments=attachments,
-        )
+        form = self.form_helper([file]) if file is not None else None
+        payload = {
+            key: value
+            for key, value in (
+                ("content", content),
+                ("embeds", embeds),
+                ("allowed_mentions", allowed_mentions),
+                ("components", componenets),
+                ("attachments", attachments),
+            )
+            if value is not None
+        }
 
         return await self.request(
             "PATCH",
-            Route(f"/webhooks/{application_id}/{interaction_token}/messages/@original"),
+            Route(_interaction_messages(application_id, interaction_token) + "/@original"),
             json=payload,
             form=form,
         )
@@ -5463,7 +5842,7 @@ class HTTPClient:
         """
         await self.request(
             "DELETE",
-            Route(f"/webhooks/{application_id}/{interaction_token}/messages/@original"),
+            Route(_interaction_messages(application_id, interaction_token) + "/@original"),
         )
 
     async def create_followup_message(
@@ -5517,27 +5896,34 @@ class HTTPClient:
         :exc:`.BadRequest`
             You somehow messed up the payload.
 
+        :exc:`asyncio.TimeoutError`
+            Discord took longer than 10 seconds to respond.
+
         Returns
         -------
         :class:`dict`
             A dict representing the created followup message.
         """
-        form = self.form_helper([file])
-        payload = update_payload(
-            {},
-            content=content,
-            embeds=embeds,
-            allowed_mentions=allowed_mentions,
-            componenets=componenets,
-            attachments=attachments,
-            flags=flags,
-        )
+        form = self.form_helper([file]) if file is not None else None
+        payload = {
+            key: value
+            for key, value in (
+                ("content", content),
+                ("embeds", embeds),
+                ("allowed_mentions", allowed_mentions),
+                ("components", componenets),
+                ("attachments", attachments),
+                ("flags", flags),
+            )
+            if value is not None
+        }
 
         return await self.request(
             "POST",
-            Route(f"/webhooks/{application_id}/{interaction_token}/messages"),
+            Route(_interaction_messages(application_id, interaction_token)),
             json=payload,
             form=form,
+            timeout=_FOLLOWUP_TIMEOUT,
         )
 
     async def get_followup_message(self, application_id: int, interaction_token: str, message_id: int) -> dict:
@@ -5568,7 +5954,7 @@ class HTTPClient:
         """
         return await self.request(
             "GET",
-            Route(f"/webhooks/{application_id}/{interaction_token}/messages/{message_id}"),
+            Route(f"{_interaction_messages(application_id, interaction_token)}/{message_id}"),
         )
 
     async def edit_followup_message(
@@ -5625,26 +6011,33 @@ class HTTPClient:
         :exc:`.BadRequest`
             You somehow messed up the payload.
 
+        :exc:`asyncio.TimeoutError`
+            Discord took longer than 10 seconds to respond.
+
         Returns
         -------
         :class:`dict`
             A dict representing the modified followup message.
         """
-        form = self.form_helper([file])
-        payload = update_payload(
-            {},
-            content=content,
-            embeds=embeds,
-            allowed_mentions=allowed_mentions,
-            componenets=componenets,
-            attachments=attachments,
-        )
+        form = self.form_helper([file]) if file is not None else None
+        payload = {
+            key: value
+            for key, value in (
+                ("content", content),
+                ("embeds", embeds),
+                ("allowed_mentions", allowed_mentions),
+                ("components", componenets),
+                ("attachments", attachments),
+            )
+            if value is not None
+        }
 
         return await self.request(
             "PATCH",
-            Route(f"/webhooks/{application_id}/{interaction_token}/messages/{message_id}"),
+            Route(f"{_interaction_messages(application_id, interaction_token)}/{message_id}"),
             json=payload,
             form=form,
+            timeout=_FOLLOWUP_TIMEOUT,
         )
 
     async def delete_followup_message(self, application_id: int, interaction_token: str, message_id: int) -> None:
@@ -5670,5 +6063,5 @@ class HTTPClient:
         """
         await self.request(
             "DELETE",
-            Route(f"/webhooks/{application_id}/{interaction_token}/messages/{message_id}"),
+            Route(f"{_interaction_messages(application_id, interaction_token)}/{message_id}"),
         )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, BinaryIO, ClassVar, Optional, Tuple, Union, Type
+from typing import TYPE_CHECKING, BinaryIO, ClassVar, Dict, Iterable, Optional, Tuple, Union, Type
+import functools
 import io
 import os
 import asyncio
@@ -15,16 +16,17 @@ __all__ = (
     "CDNAsset",
 )
 
+_WRITE_BUFFER_SIZE = 1024 * 1024
+_CDN_BASE = "https://cdn.discordapp.com/"
 
-def _sync_save(fp: str, data: bytes) -> None:
-    with open(fp, "wb") as f:
-        _sync_write(f, data)
 
-
-def _sync_write(fp: BinaryIO, data: bytes) -> None:
-    fp.write(data)
+def _open_for_write(file: Union[str, os.PathLike[str]]) -> BinaryIO:
+    # A large buffer lets several streamed chunks land in a single write call.
+    return open(file, "wb", buffering=_WRITE_BUFFER_SIZE)
 
 
+# The same hashes come up again and again as guilds and users are re-rendered.
+@functools.lru_cache(maxsize=1024)
 def is_animated(hash: str) -> Tuple[bool, str]:
     animated = hash.startswith("a_")
     format = "gif" if animated else "png"
@@ -35,94 +37,167 @@ def is_animated(hash: str) -> Tuple[bool, str]:
 class AttachmentMixin:
     """A mixin class for attachments."""
 
-    async def read(self) -> bytes:
+    __slots__ = ()
+
+    async def read(self, *, timeout: Optional[float] = None) -> bytes:
         """Gets the bytes of the attachment.
 
+        Parameters
+        ----------
+        timeout: Optional[:class:`float`]
+            The total amount of seconds the download may take
+
         Returns
         -------
         :class:`bytes`
             The bytes of the attachment.
         """
-        return await self._state.http.read_from_url(self.url)  # type: ignore
+        return await self._state.http.read_from_url(self.url, timeout=timeout)  # type: ignore
 
-    async def save(self, file: Union[BinaryIO, os.PathLike[str]]) -> None:
+    async def save(self, file: Union[str, os.PathLike[str], BinaryIO], *, timeout: Optional[float] = None) -> None:
         """Saves the attachment to a file.
 
+        The attachment is streamed to the file in chunks, so it's never
+        held in memory all at once.
+
         Parameters
         ----------
-        file: Union[:class:`typing.BinaryIO`, :class:`os.PathLike`]
+        file: Union[:class:`str`, :class:`os.PathLike`, :class:`typing.BinaryIO`]
             The file to save the data to
+
+        timeout: Optional[:class:`float`]
+            The total amount of seconds the download may take
         """
-        data = await self.read()
+        loop = asyncio.get_running_loop()
+        executor = self._state.io_executor  # type: ignore
 
         if isinstance(file, (str, os.PathLike)):
-            await asyncio.to_thread(_sync_save, file, data)
+            with await loop.run_in_executor(executor, _open_for_write, file) as fp:
+                await self._write_to(fp, timeout)
         else:
-            await asyncio.to_thread(_sync_write, file, data)
+            await self._write_to(file, timeout)
+
+    async def _write_to(self, fp: BinaryIO, timeout: Optional[float]) -> None:
+        loop = asyncio.get_running_loop()
+        executor = self._state.io_executor  # type: ignore
+
+        async for chunk in self._state.http.read_stream(self.url, timeout=timeout):  # type: ignore
+            await loop.run_in_executor(executor, fp.write, chunk)
 
 
 class Attachment(AttachmentMixin):
-    """A class used to represent attachments."""
+    """A class used to represent attachments.
+
+    Attributes
+    ----------
+    id: :class:`int`
+        The id of the attachment
+
+    filename: :class:`str`
+        The name of the file
+
+    description: Optional[:class:`str`]
+        The description of the attachment
+
+    content_type: Optional[:class:`str`]
+        The content type of the attachment
+
+    size: :class:`int`
+        The size of the attachment
+
+    url: :class:`str`
+        The url of the attachment
+
+    proxy_url: :class:`str`
+        The proxied url of the attachment
+
+    height: Optional[:class:`int`]
+        The height of the attachment
+
+    width: Optional[:class:`int`]
+        The width of the attachment
+
+    ephemeral: :class:`bool`
+        Whether or not this attachment is ephemeral
+    """
+
+    __slots__ = (
+        "_state",
+        "_data",
+        "id",
+        "filename",
+        "description",
+        "content_type",
+        "size",
+        "url",
+        "proxy_url",
+        "height",
+        "width",
+        "ephemeral",
+    )
 
     def __init__(self, state: State, data: dict) -> None:
         self._state = state
         self._data = data
 
+        # Attachments never change once sent, so every field is read once up front.
+        self.id: int = int(data["id"])
+        self.filename: str = data["filename"]
+        self.description: Optional[str] = data.get("description")
+        self.content_type: Optional[str] = data.get("content_type")
+        self.size: int = data["size"]
+        self.url: str = data["url"]
+        self.proxy_url: str = data["proxy_url"]
+        self.height: Optional[int] = data.get("height")
+        self.width: Optional[int] = data.get("width")
+        self.ephemeral: bool = data.get("ephemeral", False)
+
     def __repr__(self) -> str:
         return f"<Attachment id={self.id} filename={self.filename!r} url={self.url!r} size={self.size}>"
 
     def __str__(self) -> str:
         return self.url
 
-    @property
-    def filename(self) -> str:
-        """The name of the file."""
-        return self._data["filename"]
-
-    @property
-    def id(self) -> int:
-        """The id of the attachment."""
-        return int(self._data["id"])
-
-    @property
-    def description(self) -> Optional[str]:
-        """The description of the attachment."""
-        return self._data.get("description")
-
-    @property
-    def content_type(self) -> Optional[str]:
-        """The content type of the attachment."""
-        return self._data.get("content_type")
-
-    @property
-    def size(self) -> int:
-        """The size of the attacment."""
-        return self._data["size"]
-
-    @property
-    def url(self) -> str:
-        """The url of the attachment."""
-        return self._data["url"]
-
-    @property
-    def proxy_url(self) -> str:
-        """The proxied url of the attachment."""
-        return self._data["proxy_url"]
-
-    @property
-    def height(self) -> Optional[int]:
-        """The height of the attachment."""
-        return self._data.get("height")
-
-    @property
-    def width(self) -> Optional[int]:
-        """The width of the attachment."""
-        return self._data.get("width")
-
-    @property
-    def ephemeral(self) -> bool:
-        """Whether or not this attachment is ephemeral."""
-        return self._data.get("ephemeral", False)
+    @classmethod
+    async def gather_save(
+        cls, attachments: Iterable[Attachment], directory: Union[str, os.PathLike[str]], *, concurrency: int = 16
+    ) -> None:
+        """Saves many attachments to a directory concurrently.
+
+        Each attachment is saved as ``<id>_<filename>``, so attachments sharing a filename
+        don't overwrite each other, with at most ``concurrency`` downloads in flight at once.
+        An attachment given more than once is only saved once. If a download fails, the
+        others are cancelled.
+
+        Parameters
+        ----------
+        attachments: Iterable[:class:`.Attachment`]
+            The attachments to save
+
+        directory: Union[:class:`str`, :class:`os.PathLike`]
+            The directory to save the attachments to
+
+        concurrency: :class:`int`
+            The maximum amount of attachments to download at once
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def save(attachment: Attachment) -> None:
+            async with semaphore:
+                await attachment.save(os.path.join(directory, f"{attachment.id}_{attachment.filename}"))
+
+        unique = {attachment.id: attachment for attachment in attachments}
+        tasks = [asyncio.create_task(save(attachment)) for attachment in unique.values()]
+
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            # If a download failed, the ones still pending are cancelled and waited on
+            # so none of them keep writing after the call returns.
+            for task in tasks:
+                task.cancel()
+
+            await asyncio.gather(*tasks, return_exceptions=True)
 
     def is_spoiler(self) -> bool:
         """Checks if an attachment is a spoiler.
@@ -177,12 +252,35 @@ class CDNAsset(AttachmentMixin):
         The hash of the CDN asset
     """
 
-    BASE: ClassVar[str] = "https://cdn.discordapp.com/"
+    __slots__ = ("_state", "url", "animated", "hash")
+
+    BASE: ClassVar[str] = _CDN_BASE
+
+    # Maps each kind of asset to its path template and whether it can be animated.
+    TEMPLATES: ClassVar[Dict[str, Tuple[str, bool]]] = {
+        "emoji": ("emojis/{hash}.png", False),
+        "guild_icon": ("icons/{guild_id}/{hash}.{format}", True),
+        "guild_splash": ("splashes/{guild_id}/{hash}.png", False),
+        "guild_discovery_splash": ("discovery-splashes/{guild_id}/{hash}.png", False),
+        "guild_banner": ("banners/{guild_id}/{hash}.png", False),
+        "user_banner": ("banners/{user_id}/{hash}.{format}", True),
+        "default_user_avatar": ("embed/avatars/{hash}.png", False),
+        "user_avatar": ("avatars/{user_id}/{hash}.{format}", True),
+        "guild_member_avatar": ("guilds/{guild_id}/users/{user_id}/avatars/{hash}.{format}", True),
+        "application_icon": ("app-icons/{application_id}/{hash}.png", False),
+        "application_cover": ("app-icons/{application_id}/{hash}.png", False),
+        "application_asset": ("app-assets/{application_id}/{hash}.png", False),
+        "achievement_icon": ("achievements/{achievement_id}/{hash}.png", False),
+        "sticker_pack_banner": ("app-assets/710982414301790216/store/{hash}.png", False),
+        "team_icon": ("teams/{team_id}/{hash}.png", False),
+        "sticker": ("stickers/{hash}.png", False),
+        "role_icon": ("role-icons/{role_id}/{hash}.png", False),
+    }
 
     def __init__(self, state: State, path: str, animated: bool, hash: str) -> None:
         self._state = state
 
-        self.url = self.BASE + path
+        self.url = f"{_CDN_BASE}{path}"
         self.animated = animated
         self.hash = hash
 
@@ -192,95 +290,98 @@ class CDNAsset(AttachmentMixin):
     def __str__(self) -> str:
         return self.url
 
+    @classmethod
+    def build(cls, state: State, kind: str, hash: str, **ids: int) -> CDNAsset:
+        """Builds a CDN asset from one of the :attr:`TEMPLATES`.
+
+        Parameters
+        ----------
+        state: :class:`.State`
+            The state of the client
+
+        kind: :class:`str`
+            The kind of asset, a key of :attr:`TEMPLATES`
+
+        hash: :class:`str`
+            The hash of the asset
+
+        **ids: :class:`int`
+            The ids to fill the template with
+
+        Returns
+        -------
+        :class:`.CDNAsset`
+            The built CDN asset
+        """
+        template, can_animate = cls.TEMPLATES[kind]
+        animated, format = is_animated(hash) if can_animate else (False, "png")
+
+        return cls(state, template.format(hash=hash, format=format, **ids), animated, hash)
+
     @classmethod
     def from_emoji(cls: Type[CDNAsset], state: State, emoji_id: int) -> CDNAsset:
-        path = f"emojis/{emoji_id}.png"
-        return cls(state, path, False, str(emoji_id))
+        return cls.build(state, "emoji", str(emoji_id))
 
     @classmethod
     def from_guild_icon(cls, state: State, guild_id: int, icon_hash: str) -> CDNAsset:
-        animated, format = is_animated(icon_hash)
-
-        path = f"icons/{guild_id}/{icon_hash}.{format}"
-        return cls(state, path, animated, icon_hash)
+        return cls.build(state, "guild_icon", icon_hash, guild_id=guild_id)
 
     @classmethod
     def from_guild_splash(cls, state: State, guild_id: int, splash_hash: str) -> CDNAsset:
-        path = f"splashes/{guild_id}/{splash_hash}.png"
-        return cls(state, path, False, splash_hash)
+        return cls.build(state, "guild_splash", splash_hash, guild_id=guild_id)
 
     @classmethod
-    def from_guild_discovery_splash(cls, state: State, guild_id: int, discovery_hash: str):
-        path = f"discovery-splashes/{guild_id}/{discovery_hash}.png"
-        return cls(state, path, False, discovery_hash)
+    def from_guild_discovery_splash(cls, state: State, guild_id: int, discovery_hash: str) -> CDNAsset:
+        return cls.build(state, "guild_discovery_splash", discovery_hash, guild_id=guild_id)
 
     @classmethod
     def from_guild_banner(cls, state: State, guild_id: int, banner_hash: str) -> CDNAsset:
-        path = f"banners/{guild_id}/{banner_hash}.png"
-        return cls(state, path, False, banner_hash)
+        return cls.build(state, "guild_banner", banner_hash, guild_id=guild_id)
 
     @classmethod
     def from_user_banner(cls, state: State, user_id: int, banner_hash: str) -> CDNAsset:
-        animated, format = is_animated(banner_hash)
-
-        path = f"banners/{user_id}/{banner_hash}.{format}"
-        return cls(state, path, animated, banner_hash)
+        return cls.build(state, "user_banner", banner_hash, user_id=user_id)
 
     @classmethod
     def from_default_user_avatar(cls, state: State, discriminator: int) -> CDNAsset:
-        path = f"embed/avatars/{discriminator}.png"
-        return cls(state, path, False, str(discriminator))
+        return cls.build(state, "default_user_avatar", str(discriminator))
 
     @classmethod
     def from_user_avatar(cls, state: State, user_id: int, avatar_hash: str) -> CDNAsset:
-        animated, format = is_animated(avatar_hash)
-
-        path = f"avatars/{user_id}/{avatar_hash}.{format}"
-        return cls(state, path, animated, avatar_hash)
+        return cls.build(state, "user_avatar", avatar_hash, user_id=user_id)
 
     @classmethod
     def from_guild_member_avatar(cls, state: State, guild_id: int, user_id: int, avatar_hash: str) -> CDNAsset:
-        animated, format = is_animated(avatar_hash)
-
-        path = f"guilds/{guild_id}/users/{user_id}/avatars/{avatar_hash}.{format}"
-        return cls(state, path, animated, avatar_hash)
+        return cls.build(state, "guild_member_avatar", avatar_hash, guild_id=guild_id, user_id=user_id)
 
     @classmethod
     def from_application_icon(cls, state: State, application_id: int, icon_hash: str) -> CDNAsset:
-        path = f"app-icons/{application_id}/{icon_hash}.png"
-        return cls(state, path, False, icon_hash)
+        return cls.build(state, "application_icon", icon_hash, application_id=application_id)
 
     @classmethod
     def from_application_cover(cls, state: State, application_id: int, cover_hash: str) -> CDNAsset:
-        path = f"app-icons/{application_id}/{cover_hash}.png"
-        return cls(state, path, False, cover_hash)
+        return cls.build(state, "application_cover", cover_hash, application_id=application_id)
 
     @classmethod
     def from_application_asset(cls, state: State, application_id: int, asset_hash: str) -> CDNAsset:
-        path = f"app-assets/{application_id}/{asset_hash}.png"
-        return cls(state, path, False, asset_hash)
+        return cls.build(state, "application_asset", asset_hash, application_id=application_id)
 
     @classmethod
     def from_achievement_icon(cls, state: State, achievement_id: int, icon_hash: str) -> CDNAsset:
-        path = f"achievements/{achievement_id}/{icon_hash}.png"
-        return cls(state, path, False, icon_hash)
+        return cls.build(state, "achievement_icon", icon_hash, achievement_id=achievement_id)
 
     @classmethod
     def from_sticker_pack_banner(cls, state: State, banner_id: int) -> CDNAsset:
-        path = f"app-assets/710982414301790216/store/{banner_id}.png"
-        return cls(state, path, False, str(banner_id))
+        return cls.build(state, "sticker_pack_banner", str(banner_id))
 
     @classmethod
     def from_team_icon(cls, state: State, team_id: int, icon_hash: str) -> CDNAsset:
-        path = f"teams/{team_id}/{icon_hash}.png"
-        return cls(state, path, False, icon_hash)
+        return cls.build(state, "team_icon", icon_hash, team_id=team_id)
 
     @classmethod
     def from_sticker(cls, state: State, sticker_id: int) -> CDNAsset:
-        path = f"stickers/{sticker_id}.png"
-        return cls(state, path, False, str(sticker_id))
+        return cls.build(state, "sticker", str(sticker_id))
 
     @classmethod
     def from_role_icon(cls, state: State, role_id: int, icon_hash: str) -> CDNAsset:
-        path = f"role-iconss/{role_id}/{icon_hash}.png"
-        return cls(state, path, False, icon_hash)
+        return cls.build(state, "role_icon", icon_hash, role_id=role_id)
@@ -5,6 +5,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Iterator,
     List,
     Optional,
     Type,
@@ -25,42 +26,52 @@ from .permissions import Permissions
 from .role import PartialRole
 from .attachments import CDNAsset
 
-_member_events = (
-    AuditLogsEvent.MEMBER_ROLE_UPDATE,
-    AuditLogsEvent.MEMBER_UPDATE,
-    AuditLogsEvent.MEMBER_PRUNE,
-    AuditLogsEvent.MEMBER_BAN_ADD,
-    AuditLogsEvent.MEMBER_BAN_REMOVE,
-    AuditLogsEvent.MEMBER_KICK,
-    AuditLogsEvent.MEMBER_DISCONNECT,
+_member_events = frozenset(
+    (
+        AuditLogsEvent.MEMBER_ROLE_UPDATE,
+        AuditLogsEvent.MEMBER_UPDATE,
+        AuditLogsEvent.MEMBER_PRUNE,
+        AuditLogsEvent.MEMBER_BAN_ADD,
+        AuditLogsEvent.MEMBER_BAN_REMOVE,
+        AuditLogsEvent.MEMBER_KICK,
+        AuditLogsEvent.MEMBER_DISCONNECT,
+    )
 )
 
-_channel_events = (
-    AuditLogsEvent.CHANNEL_CREATE,
-    AuditLogsEvent.CHANNEL_UPDATE,
-    AuditLogsEvent.CHANNEL_DELETE,
-    AuditLogsEvent.CHANNEL_OVERWRITE_CREATE,
-    AuditLogsEvent.CHANNEL_OVERWRITE_UPDATE,
-    AuditLogsEvent.CHANNEL_OVERWRITE_DELETE,
+_channel_events = frozenset(
+    (
+        AuditLogsEvent.CHANNEL_CREATE,
+        AuditLogsEvent.CHANNEL_UPDATE,
+        AuditLogsEvent.CHANNEL_DELETE,
+        AuditLogsEvent.CHANNEL_OVERWRITE_CREATE,
+        AuditLogsEvent.CHANNEL_OVERWRITE_UPDATE,
+        AuditLogsEvent.CHANNEL_OVERWRITE_DELETE,
+    )
 )
 
-_role_events = (
-    AuditLogsEvent.ROLE_CREATE,
-    AuditLogsEvent.ROLE_UPDATE,
-    AuditLogsEvent.ROLE_DELETE,
+_role_events = frozenset(
+    (
+        AuditLogsEvent.ROLE_CREATE,
+        AuditLogsEvent.ROLE_UPDATE,
+        AuditLogsEvent.ROLE_DELETE,
+    )
 )
 
-_thread_events = (
-    AuditLogsEvent.THREAD_CREATE,
-    AuditLogsEvent.THREAD_UPDATE,
-    AuditLogsEvent.THREAD_DELETE,
+_thread_events = frozenset(
+    (
+        AuditLogsEvent.THREAD_CREATE,
+        AuditLogsEvent.THREAD_UPDATE,
+        AuditLogsEvent.THREAD_DELETE,
+    )
 )
 
-_message_events = (
-    AuditLogsEvent.MESSAGE_DELETE,
-    AuditLogsEvent.MESSAGE_BULK_DELETE,
-    AuditLogsEvent.MESSAGE_PIN,
-    AuditLogsEvent.MESSAGE_UNPIN,
+_message_events = frozenset(
+    (
+        AuditLogsEvent.MESSAGE_DELETE,
+        AuditLogsEvent.MESSAGE_BULK_DELETE,
+        AuditLogsEvent.MESSAGE_PIN,
+        AuditLogsEvent.MESSAGE_UNPIN,
+    )
 )
 
 if TYPE_CHECKING:
@@ -272,7 +283,45 @@ _handlers: Dict[str, Callable[[AuditLogChange, Any], Change]] = {
 }
 
 
+def _guild_target(entry: AuditLogEntry) -> Target:
+    return entry._guild
+
+
+def _member_target(entry: AuditLogEntry) -> Target:
+    return _get(entry._get_member, entry.target_id)
+
+
+def _role_target(entry: AuditLogEntry) -> Target:
+    return _get(entry._guild.get_role, entry.target_id)
+
+
+def _channel_target(entry: AuditLogEntry) -> Target:
+    return _get(entry._guild.get_channel, entry.target_id)
+
+
+def _thread_target(entry: AuditLogEntry) -> Target:
+    return _get(entry._guild.get_thread, entry.target_id)
+
+
+def _message_target(entry: AuditLogEntry) -> Target:
+    return _get(entry._state.get_message, entry.target_id)
+
+
+_target_resolvers: Dict[AuditLogsEvent, Callable[[AuditLogEntry], Target]] = {
+    AuditLogsEvent.GUILD_UPDATE: _guild_target,
+    **dict.fromkeys(_member_events, _member_target),
+    **dict.fromkeys(_role_events, _role_target),
+    **dict.fromkeys(_channel_events, _channel_target),
+    **dict.fromkeys(_thread_events, _thread_target),
+    **dict.fromkeys(_message_events, _message_target),
+}
+
+
 class AuditLogChange:
+    # ``__dict__`` is only there for the cached properties, it isn't
+    # created until one of them is accessed.
+    __slots__ = ("_data", "_entry", "__dict__")
+
     def __init__(self, entry: AuditLogEntry, data: Dict) -> None:
         self._data = data
         self._entry = entry
@@ -301,11 +350,14 @@ class AuditLogChange:
 
 
 class AuditLogEntry:
+    __slots__ = ("_state", "_guild", "_data", "_users", "_target_id", "__dict__")
+
     def __init__(self, users: Dict[int, User], state: State, guild: Guild, data: Dict) -> None:
         self._state = state
         self._guild = guild
         self._data = data
         self._users = users
+        self._target_id: Optional[int] = to_snowflake(data, "target_id")
 
     def _get_member(self, value: int) -> Optional[Union[Member, User]]:
         return self._guild.get_member(value) or self._users.get(value)
@@ -314,39 +366,33 @@ class AuditLogEntry:
     def guild(self) -> Guild:
         return self._guild
 
-    @property
+    @cached_property
     def changes(self) -> List[AuditLogChange]:
-        return [AuditLogChange(self, change) for change in self._data.get("changes", [])]
+        return list(self.iter_changes())
 
-    @property
+    def iter_changes(self) -> Iterator[AuditLogChange]:
+        # Reuse the cached list if it was already built, otherwise
+        # create the changes one at a time so an early exit skips the rest.
+        if "changes" in self.__dict__:
+            return iter(self.changes)
+
+        return (AuditLogChange(self, change) for change in self._data.get("changes", []))
+
+    @cached_property
     def action(self) -> AuditLogsEvent:
         return AuditLogsEvent(self._data["action_type"])
 
     @property
     def target_id(self) -> Optional[int]:
-        return to_snowflake(self._data, "target_id")
+        return self._target_id
 
     @cached_property
     def target(self) -> Target:
-        if self.action is AuditLogsEvent.GUILD_UPDATE:
-            return self._guild
-
-        if self.action in _member_events:
-            return _get(self._get_member, self.target_id)
-
-        if self.action in _role_events:
-            return _get(self._guild.get_role, self.target_id)
-
-        if self.action in _channel_events:
-            return _get(self._guild.get_channel, self.target_id)
-
-        if self.action in _thread_events:
-            return _get(self._guild.get_thread, self.target_id)
-
-        if self.action in _message_events:
-            return _get(self._state.get_message, self.target_id)
+        resolver = _target_resolvers.get(self.action)
+        if resolver is None:
+            return Object(id=self.target_id)  # type: ignore
 
-        return Object(id=self.target_id)  # type: ignore
+        return resolver(self)
 
     @property
     def user_id(self) -> Optional[int]:
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional, List, Callable, Iterable
+from typing import TYPE_CHECKING, AsyncIterator, Optional, List, Callable, Iterable
 import asyncio
 import datetime
+from operator import attrgetter, methodcaller
 
 from .embed import Embed
 from .files import File
 from .components import ActionRow
-from ..utils import Snowflake, ChannelHistoryIterator, grouper
+from ..utils import Snowflake, ChannelHistoryIterator
 from .mentions import AllowedMentions
 
 if TYPE_CHECKING:
@@ -17,6 +18,12 @@ if TYPE_CHECKING:
 
 __all__ = ("Messageable", "BaseTextChannel")
 
+# How many deletes purge may have in flight at once.
+PURGE_CONCURRENCY = 5
+
+_get_id = attrgetter("id")
+_to_dict = methodcaller("to_dict")
+
 
 class Messageable(Snowflake):
     """Represents a messageable object."""
@@ -76,46 +83,46 @@ class Messageable(Snowflake):
         :exc:`.Forbidden`
             Your client doesn't have permissions to send messages.
 
+        :exc:`ValueError`
+            More than 3 stickers were given, or the message is empty. A message without content, embeds, files,
+            stickers or rows is empty, and empty lists count as not given. This is raised before any request is made.
+
         Returns
         -------
         :class:`.Message`
             A message object representing the sent message.
         """
-        embeds = [] if embeds is None else embeds
-        files = [] if files is None else files
-        sticker_ids = [] if stickers is None else [s.id for s in stickers]
-
-        if len(sticker_ids) > 3:
+        sticker_ids = list(map(_get_id, stickers)) if stickers else None
+        if sticker_ids is not None and len(sticker_ids) > 3:
             raise ValueError("Maximum of 3 stickers can be sent at once.")
 
-        req = self._state.client.http.send_message
-
-        message_reference = reference.to_reference() if reference else None
-        actionrows_ = [r.to_dict() for r in rows] if rows else []
-        embeds_ = [e.to_dict() for e in embeds] if embeds else []
-        files = files if files is not None else []
-
+        # Payload pieces are only built when they were given, empty ones are left out entirely.
+        embeds_ = list(map(_to_dict, embeds)) if embeds else []
         if embed is not None:
             embeds_.append(embed.to_dict())
 
         if file is not None:
-            files.append(file)
+            files = [*files, file] if files else [file]
+
+        actionrows_ = list(map(_to_dict, rows)) if rows else None
+
+        if content is None and not embeds_ and not files and not sticker_ids and not actionrows_:
+            raise ValueError("Cannot send an empty message.")
 
         channel = getattr(self, "channel", self)
-        data = await req(
+        data = await self._state.client.http.send_message(
             channel_id=channel.id,
             content=content,
             tts=tts,
-            embeds=embeds_,
-            message_reference=message_reference,
+            embeds=embeds_ or None,
+            message_reference=reference.to_reference() if reference is not None else None,
             files=files,
             allowed_mentions=allowed_mentions.to_dict() if allowed_mentions is not None else None,
             sticker_ids=sticker_ids,
             components=actionrows_,
         )
 
-        rows = rows or []
-        for row in rows:
+        for row in rows or []:
             row._cache_components(self._state)
 
         return self._state.create_message(data, channel)
@@ -151,21 +158,36 @@ class Messageable(Snowflake):
         data = await self._state.http.get_pinned_messages(self.id)
         return [self._state.create_message(m, self) for m in data]
 
+    async def iter_pins(self) -> AsyncIterator[Message]:
+        """Iterates over the pinned messages.
+
+        Unlike :meth:`fetch_pins`, each message is only created once it's reached,
+        so breaking out early skips creating the rest.
+
+        Yields
+        ------
+        :class:`.Message`
+            A pinned message.
+        """
+        data = await self._state.http.get_pinned_messages(self.id)
+        for payload in data:
+            yield self._state.create_message(payload, self)
+
     def history(self, **kwargs) -> ChannelHistoryIterator:
         """Fetches the history of messages.
 
         Parameters
         ----------
         kwargs: Any
-            The options to pass to :meth:`.HTTPClient.get_channel_messages`
+            The options to pass to :class:`.ChannelHistoryIterator`.
+            ``limit`` may be more than 100, in which case the history is paginated
 
         Returns
         -------
         :class:`.ChannelHistoryIterator`
             An Iterator for the channel's history
         """
-        coro = self._state.http.get_channel_messages(self.id, **kwargs)
-        return ChannelHistoryIterator(self._state, self, coro)
+        return ChannelHistoryIterator(self._state, self, **kwargs)
 
 
 class BaseTextChannel(Messageable):
@@ -179,7 +201,7 @@ class BaseTextChannel(Messageable):
         messages: Iterable[:class:`.Message`]
             The messages to delete
         """
-        await self._state.http.bulk_delete_messages(self.id, message_ids=[msg.id for msg in messages])
+        await self._state.http.bulk_delete_messages(self.id, message_ids=list(map(_get_id, messages)))
 
     async def purge(
         self,
@@ -214,29 +236,48 @@ class BaseTextChannel(Messageable):
         List[:class:`.Message`]
             A list of the deleted messages.
         """
-        now = datetime.datetime.utcnow()
-
-        if not check:
-            check = lambda _: True
-
-        iterator = self.history(limit=limit, before=before, around=around, after=after)
-        to_delete: List[Message] = [message async for message in iterator if check(message)]
-
-        for message in to_delete:
-            delta = now - message.created_at
-
-            if delta.days >= 14:
-                await message.delete()
-                to_delete.remove(message)
-
-        for group in grouper(100, to_delete):
-            if len(group) < 2:
-                for message in group:
-                    await message.delete()
-
-                    continue
-
-            await self.delete_messages(group)
-            await asyncio.sleep(1)
+        now = datetime.datetime.now(datetime.timezone.utc)
+        semaphore = asyncio.Semaphore(PURGE_CONCURRENCY)
+
+        async def delete(messages: List[Message]) -> None:
+            async with semaphore:
+                if len(messages) == 1:
+                    await messages[0].delete()
+                else:
+                    await self.delete_messages(messages)
+
+        to_delete: List[Message] = []
+        tasks: List[asyncio.Task[None]] = []
+        bulk: List[Message] = []
+
+        iterator = self.history(limit=limit, before=before, around=around, after=after, check=check)
+
+        # Chunks are deleted as soon as they fill up, so the deletes overlap with fetching the rest of the history.
+        try:
+            async with iterator:
+                async for message in iterator:
+                    to_delete.append(message)
+
+                    # Messages older than 14 days can't be bulk deleted.
+                    if (now - message.created_at).days >= 14:
+                        tasks.append(asyncio.create_task(delete([message])))
+                        continue
+
+                    bulk.append(message)
+                    if len(bulk) == 100:
+                        tasks.append(asyncio.create_task(delete(bulk)))
+                        bulk = []
+
+            if bulk:
+                tasks.append(asyncio.create_task(delete(bulk)))
+
+            await asyncio.gather(*tasks)
+        finally:
+            # If anything failed, the deletes that are still pending are cancelled and waited on
+            # so none of them outlive the call or have their errors go unretrieved.
+            for task in tasks:
+                task.cancel()
+
+            await asyncio.gather(*tasks, return_exceptions=True)
 
         return to_delete
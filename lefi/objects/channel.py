@@ -4,12 +4,16 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Dict,
+    Iterable,
     List,
     Optional,
     Union,
     Protocol,
+    Tuple,
+    Type,
 )
 from functools import cached_property
+import functools
 
 from .enums import ChannelType, InviteTargetType
 from .permissions import Overwrite
@@ -18,44 +22,125 @@ from .invite import Invite
 from ..errors import VoiceException
 from ..utils import to_snowflake
 from ..voice import VoiceClient
-from .threads import Thread
+from .threads import AUTO_ARCHIVE_DURATIONS, Thread
 from .base import Messageable, BaseTextChannel
+from .role import Role
 
 if TYPE_CHECKING:
     from ..state import State
     from .guild import Guild
     from .member import Member
     from .message import Message
-    from .role import Role
     from .user import User
 
 __all__ = ("TextChannel", "DMChannel", "VoiceChannel", "CategoryChannel", "Channel")
 
+# Looking the member up directly skips going through ``EnumMeta.__call__`` for every channel.
+_channel_types: Dict[int, ChannelType] = {type.value: type for type in ChannelType}
+
+# Flag members are looked up through the metaclass, so the bit is read once here.
+_ADMINISTRATOR = int(Permissions.administrator)
+_ALL_PERMISSIONS = Permissions.__all_value__
+
+
+@functools.lru_cache(maxsize=None)
+def _member_class() -> Type[Member]:
+    # member.py imports this module through user.py, so it can't be imported at the top.
+    from .member import Member  # noqa: F811
+
+    return Member
+
+
+def _is_member(target: Union[Member, Role]) -> bool:
+    # Snowflake is a Protocol, which makes a failing isinstance check slow,
+    # so the exact classes are compared first.
+    cls = type(target)
+    if cls is Role:
+        return False
+
+    member = _member_class()
+    return cls is member or isinstance(target, member)
+
+
+def _fold_overwrites(base: int, bits: Dict[int, Tuple[int, int]], role_ids: Iterable[int], member_id: int) -> int:
+    # Role overwrites are combined before being applied, then the member's own overwrite goes on top.
+    allow = 0
+    deny = 0
+
+    for role_id in role_ids:
+        pair = bits.get(role_id)
+        if pair is not None:
+            allow |= pair[0]
+            deny |= pair[1]
+
+    base = (base | allow) & ~deny
+
+    member = bits.get(member_id)
+    if member is not None:
+        base = (base | member[0]) & ~member[1]
+
+    return base
+
 
 class Channel:
     """A class representing a discord channel"""
 
     def __init__(self, state: State, data: dict, guild: Guild) -> None:
-        self._overwrites: Dict[Union[Member, Role], Overwrite] = {}
         self._state = state
-        self._data = data
         self._guild = guild
+        self._set_overwrites({})
+        self._update(data)
+
+    def _update(self, data: dict) -> None:
+        # Fields are parsed once here instead of on every property access,
+        # so anything replacing the raw data has to go through this method.
+        self._data = data
+        # Only the id and type are present in every channel payload, anything else may be missing,
+        # e.g. group DMs that end up here as a plain channel have no position.
+        self._id = int(data["id"])
+        self._name: Optional[str] = data.get("name")
+        # Types the library doesn't know about yet are kept as plain ints.
+        self._type: Union[ChannelType, int] = _channel_types.get(data["type"], data["type"])
+        self._nsfw: bool = data.get("nsfw", False)
+        self._position: Optional[int] = data.get("position")
 
     def __repr__(self) -> str:
-        name = self.__class__.__name__
-        return f"<{name} name={self.name!r} id={self.id} position={self.position} type={self.type!r}>"
+        name = type(self).__name__
+        return f"<{name} name={self._name!r} id={self._id} position={self._position} type={self._type!r}>"
 
     def _copy(self):
-        copy = self.__class__(self._state, self._data, self._guild)
+        # Everything is already parsed, so the attributes are copied over instead of running ``__init__`` again.
+        cls = self.__class__
+        copy = cls.__new__(cls)
+        copy.__dict__.update(self.__dict__)
+
+        # These are mutated in place, so the copy needs its own.
         copy._overwrites = self._overwrites.copy()
+        copy._overwrite_bits = self._overwrite_bits.copy()
 
         return copy
 
+    def _set_overwrites(self, overwrites: Dict[Union[Member, Role], Overwrite]) -> None:
+        self._overwrites = overwrites
+
+        # The raw (allow, deny) bits of every overwrite keyed by its id, so
+        # permissions_for can fold them without building Permissions objects.
+        self._overwrite_bits: Dict[int, Tuple[int, int]] = {
+            overwrite.id: (overwrite._allow, overwrite._deny) for overwrite in overwrites.values()
+        }
+        # The @everyone role shares its id with the guild.
+        self._everyone_bits = self._overwrite_bits.get(self._guild.id, (0, 0))
+
     def __eq__(self, o: object) -> bool:
-        if not isinstance(o, Channel):
+        # Comparing two channels of the same class is by far the most common case,
+        # so it's checked before falling back to the isinstance check.
+        if o.__class__ is not self.__class__ and not isinstance(o, Channel):
             return NotImplemented
 
-        return self.id == o.id
+        return self._id == o._id  # type: ignore
+
+    def __hash__(self) -> int:
+        return hash(self._id)
 
     async def delete(self) -> None:
         """Deletes the channel
@@ -91,7 +176,7 @@ class Channel:
         :exc:`.Forbidden`
             Your client doesn't have permissions to edit this permission.
         """
-        if not isinstance(target, (Role, Member)):
+        if not isinstance(target, Role) and not _is_member(target):
             raise TypeError("target must be either a Role or Member")
 
         perms = Permissions(**permissions)
@@ -125,7 +210,7 @@ class Channel:
         :exc:`.Forbidden`
             Your client doesn't have permissions to delete this permission.
         """
-        if not isinstance(target, (Member, Role)):
+        if not isinstance(target, Role) and not _is_member(target):
             raise TypeError("target must be either a Member or Role")
 
         await self._state.http.delete_channel_permissions(
@@ -134,6 +219,8 @@ class Channel:
         )
 
         self._overwrites.pop(target, None)
+        self._overwrite_bits.pop(target.id, None)
+        self._everyone_bits = self._overwrite_bits.get(self._guild.id, (0, 0))
 
     @property
     def guild(self) -> Guild:
@@ -143,27 +230,30 @@ class Channel:
     @property
     def id(self) -> int:
         """The id of the channel."""
-        return int(self._data["id"])
+        return self._id
 
     @property
-    def name(self) -> str:
+    def name(self) -> Optional[str]:
         """The name of the channel."""
-        return self._data["name"]
+        return self._name
 
     @property
-    def type(self) -> ChannelType:
-        """The type of the channel."""
-        return ChannelType(self._data["type"])
+    def type(self) -> Union[ChannelType, int]:
+        """The type of the channel.
+
+        This is a plain :class:`int` if the type isn't a member of :class:`.ChannelType`.
+        """
+        return self._type
 
     @property
     def nsfw(self) -> bool:
         """Whether or not the channel is marked as NSFW."""
-        return self._data.get("nsfw", False)
+        return self._nsfw
 
     @property
-    def position(self) -> int:
+    def position(self) -> Optional[int]:
         """The position of the channel."""
-        return self._data["position"]
+        return self._position
 
     @property
     def overwrites(self) -> Dict[Union[Member, Role], Overwrite]:
@@ -202,37 +292,58 @@ class Channel:
         :class:`.Permissions`
             The permissions for the specified target.
         """
-        base = target.permissions
+        base = target.permissions.value
 
-        if base & Permissions.administrator:
-            return Permissions.all()
+        if base & _ADMINISTRATOR:
+            return Permissions(_ALL_PERMISSIONS)
 
-        everyone = self.overwrites_for(self.guild.default_role)
-        if everyone is not None:
-            base |= everyone.allow
-            base &= ~everyone.deny
+        bits = self._overwrite_bits
+        if not bits:
+            return Permissions(base)
 
-        allow = Permissions(0)
-        deny = Permissions(0)
+        everyone_allow, everyone_deny = self._everyone_bits
+        base = (base | everyone_allow) & ~everyone_deny
 
-        if isinstance(target, Member):
-            for role in target.roles:
-                overwrite = self.overwrites_for(role)
-                if overwrite is not None:
-                    allow |= overwrite.allow
-                    deny |= overwrite.deny
+        # Roles only get the @everyone overwrite, the rest only applies to members.
+        if not _is_member(target):
+            return Permissions(base)
 
-            base |= allow
-            base &= ~deny
+        return Permissions(_fold_overwrites(base, bits, target._roles, target.id))  # type: ignore
 
-            member_overwrite = self.overwrites_for(target)
-            if member_overwrite:
-                base |= member_overwrite.allow
-                base &= ~member_overwrite.deny
+    def permissions_for_many(self, members: Iterable[Member]) -> Dict[Member, Permissions]:
+        """Returns the permissions for many members at once.
 
-            return base
+        This gives the same results as calling :meth:`permissions_for` for every member,
+        but the channel's overwrites are only looked up once.
 
-        return base
+        Parameters
+        ----------
+        members: Iterable[:class:`.Member`]
+            The members to get the permissions for
+
+        Returns
+        -------
+        Dict[:class:`.Member`, :class:`.Permissions`]
+            A mapping of each member to their permissions.
+        """
+        bits = self._overwrite_bits
+        everyone_allow, everyone_deny = self._everyone_bits
+
+        permissions: Dict[Member, Permissions] = {}
+        for member in members:
+            base = member.permissions.value
+            if base & _ADMINISTRATOR:
+                permissions[member] = Permissions(_ALL_PERMISSIONS)
+                continue
+
+            if not bits:
+                permissions[member] = Permissions(base)
+                continue
+
+            base = (base | everyone_allow) & ~everyone_deny
+            permissions[member] = Permissions(_fold_overwrites(base, bits, member._roles, member.id))
+
+        return permissions
 
 
 class TextChannel(Channel, BaseTextChannel):  # type: ignore
@@ -241,6 +352,14 @@ class TextChannel(Channel, BaseTextChannel):  # type: ignore
     def __init__(self, state: State, data: dict, guild: Guild) -> None:
         super().__init__(state, data, guild)
 
+    def _update(self, data: dict) -> None:
+        super()._update(data)
+        self._topic: Optional[str] = data.get("topic")
+        self._last_message_id = to_snowflake(data, "last_message_id")
+        self._slowmode: int = data.get("rate_limit_per_user", 0)
+        self._default_auto_archive_duration: Optional[int] = data.get("default_auto_archive_duration")
+        self._parent_id = to_snowflake(data, "parent_id")
+
     async def edit(
         self,
         *,
@@ -304,7 +423,7 @@ class TextChannel(Channel, BaseTextChannel):  # type: ignore
             rate_limit_per_user=slowmode,
             permission_overwrites=permission_overwrites,
         )
-        self._data = data
+        self._update(data)
         return self
 
     async def create_invite(
@@ -404,9 +523,8 @@ class TextChannel(Channel, BaseTextChannel):  # type: ignore
         :class:`.Thread`
             The newly created thread.
         """
-        if auto_archive_duration is not None:
-            if auto_archive_duration not in (60, 1440, 4320, 10080):
-                raise ValueError("auto_archive_duration must be 60, 1440, 4320 or 10080")
+        if auto_archive_duration is not None and auto_archive_duration not in AUTO_ARCHIVE_DURATIONS:
+            raise ValueError("auto_archive_duration must be 60, 1440, 4320 or 10080")
 
         if not type:
             type = ChannelType.PRIVATE_THREAD
@@ -486,39 +604,43 @@ class TextChannel(Channel, BaseTextChannel):  # type: ignore
         return self.guild._create_threads(data)
 
     @property
-    def topic(self) -> str:
+    def topic(self) -> Optional[str]:
         """The topic of the channel."""
-        return self._data["topic"]
+        return self._topic
 
     @property
     def last_message_id(self) -> Optional[int]:
         """The id of the last sent message."""
-        return to_snowflake(self._data, "last_message_id")
+        return self._last_message_id
 
     @property
     def last_message(self) -> Optional[Message]:
         """The last message sent in this channel."""
-        return self._state.get_message(self.last_message_id) if self.last_message_id else None
+        return self._state.get_message(self._last_message_id) if self._last_message_id else None
 
     @property
     def slowmode(self) -> int:
         """The current slowmode of the channel."""
-        return self._data["rate_limit_per_user"]
+        return self._slowmode
 
     @property
-    def default_auto_archive_duration(self) -> int:
+    def default_auto_archive_duration(self) -> Optional[int]:
         """The amount of time it takes to archive a thread inside of the channel."""
-        return self._data["default_auto_archive_duration"]
+        return self._default_auto_archive_duration
 
     @property
     def parent_id(self) -> Optional[int]:
         """The id of the channel's parent if there is one."""
-        return to_snowflake(self._data, "parent_id")
+        return self._parent_id
 
     @property
     def parent(self) -> Optional[CategoryChannel]:
         """The channels parent if there is one."""
-        return self.guild.get_channel(self.parent_id)  # type: ignore
+        # This is looked up every time, so a deleted or replaced category is never returned.
+        if self._parent_id is None:
+            return None
+
+        return self._guild.get_channel(self._parent_id)  # type: ignore
 
     @property
     def category(self) -> Optional[CategoryChannel]:
@@ -532,6 +654,13 @@ class VoiceChannel(Channel):
     def __init__(self, state: State, data: dict, guild: Guild) -> None:
         super().__init__(state, data, guild)
 
+    def _update(self, data: dict) -> None:
+        super()._update(data)
+        self._user_limit: int = data.get("user_limit", 0)
+        self._bitrate: int = data["bitrate"]
+        self._rtc_region: Optional[str] = data.get("rtc_region")
+        self._parent_id = to_snowflake(data, "parent_id")
+
     async def create_invite(
         self,
         *,
@@ -647,7 +776,7 @@ class VoiceChannel(Channel):
             sync_permissions=sync_permissions,
             permission_overwrites=permission_overwrites,
         )
-        self._data = data
+        self._update(data)
         return self
 
     async def connect(self) -> VoiceClient:
@@ -683,27 +812,31 @@ class VoiceChannel(Channel):
     @property
     def user_limit(self) -> int:
         """The user limit of the voice channel."""
-        return self._data["user_limit"]
+        return self._user_limit
 
     @property
     def bitrate(self) -> int:
         """The bitrate of the voice channel."""
-        return self._data["bitrate"]
+        return self._bitrate
 
     @property
     def rtc_region(self) -> Optional[str]:
         """The rtc region of the voice channel."""
-        return self._data["rtc_region"]
+        return self._rtc_region
 
     @property
     def parent_id(self) -> Optional[int]:
         """The ID of the parent channel if there is one."""
-        return to_snowflake(self._data, "parent_id")
+        return self._parent_id
 
     @property
     def parent(self) -> Optional[CategoryChannel]:
         """The channels parent if there is one."""
-        return self.guild.get_channel(self.parent_id)  # type: ignore
+        # This is looked up every time, so a deleted or replaced category is never returned.
+        if self._parent_id is None:
+            return None
+
+        return self._guild.get_channel(self._parent_id)  # type: ignore
 
     @property
     def category(self) -> Optional[CategoryChannel]:
@@ -837,30 +970,61 @@ class DMChannel(Messageable):
         self._data = data
         self.guild = None
 
+        self._id = int(data["id"])
+        self._type: int = data["type"]
+        self._last_message_id = to_snowflake(data, "last_message_id")
+        self._recipient_ids = tuple(int(recipient["id"]) for recipient in data.get("recipients", ()))
+        self._recipients: Optional[Tuple[User, ...]] = None
+
     def __repr__(self) -> str:
         return f"<DMChannel id={self.id} type={self.type!r}>"
 
+    def __eq__(self, o: object) -> bool:
+        if o.__class__ is not self.__class__ and not isinstance(o, DMChannel):
+            return NotImplemented
+
+        return self._id == o._id  # type: ignore
+
+    def __hash__(self) -> int:
+        return hash(self._id)
+
     @property
     def id(self) -> int:  # type: ignore
         """The ID of the DMChannel."""
-        return int(self._data["id"])
+        return self._id
 
     @property
     def last_message_id(self) -> Optional[int]:
         """The id of the last sent message."""
-        return to_snowflake(self._data, "last_message_id")
+        return self._last_message_id
 
     @property
     def last_message(self) -> Optional[Message]:
         """The last sent message in this channel."""
-        return self._state.get_message(self.last_message_id)  # type: ignore
+        return self._state.get_message(self._last_message_id)  # type: ignore
 
     @property
     def type(self) -> int:
         """The type of the channel."""
-        return int(self._data["type"])
+        return self._type
+
+    @property
+    def recipients(self) -> List[User]:
+        """A list of recipients."""
+        # The cache is a tuple so that changes to the returned list can't leak into it.
+        if self._recipients is not None:
+            return list(self._recipients)
+
+        recipients = [self._state.get_user(user_id) for user_id in self._recipient_ids]
+
+        # Only keep the recipients around once every one of them is cached,
+        # otherwise users which show up later would never be picked up.
+        if all(user is not None for user in recipients):
+            self._recipients = tuple(recipients)  # type: ignore
+
+        return recipients  # type: ignore
 
     @property
     def receipients(self) -> List[User]:
-        """A list of receipients."""
-        return [self._state.get_user(int(data["id"])) for data in self._data["recipients"]]  # type: ignore
+        """An alias of :attr:`.DMChannel.recipients`."""
+        return self.recipients
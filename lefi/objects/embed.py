@@ -1,10 +1,9 @@
 from __future__ import annotations
 
 import datetime
+from operator import methodcaller
 from typing import TYPE_CHECKING, Dict, List, Optional, Type, Protocol, Any
 
-from ..utils.payload import update_payload
-
 if TYPE_CHECKING:
 
     class _EmbedItem(Protocol):
@@ -46,12 +45,17 @@ if TYPE_CHECKING:
 
 __all__ = ("Embed",)
 
+_item_to_dict = methodcaller("to_dict")
+
 
 class EmbedItem:
     def __init__(self, **kwargs: Any) -> None:
         self.data = kwargs
         self.__dict__.update(kwargs)
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {key: value for key, value in self.data.items() if value is not None}
+
 
 class Embed:
     """Represents an embed.
@@ -105,12 +109,12 @@ class Embed:
 
         for name, item in payload.items():
             if isinstance(item, EmbedItem):
-                payload[name] = update_payload({}, **item.data)
+                payload[name] = item.to_dict()
 
                 continue
 
             elif isinstance(item, list) and all(isinstance(obj, EmbedItem) for obj in item):
-                payload[name] = [update_payload({}, **field.data) for field in item]
+                payload[name] = list(map(_item_to_dict, item))
 
         return payload
 
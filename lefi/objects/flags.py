@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import functools
+import operator
 from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar, Union
 
 __all__ = (
@@ -51,6 +53,7 @@ class FlagValue(int):
 
 class FlagMeta(type):
     __members__: Dict[str, FlagValue]
+    __all_value__: int
 
     def __new__(cls, name: str, bases: Tuple[Type], attrs: Dict[str, Any]):
         members: Dict[str, FlagValue] = {}
@@ -62,6 +65,9 @@ class FlagMeta(type):
                 del attrs[attr]
 
         attrs["__members__"] = members
+
+        # Every flag set at once, so ``all()`` doesn't have to go through the keyword path.
+        attrs["__all_value__"] = functools.reduce(operator.or_, members.values(), 0)
         return super().__new__(cls, name, bases, attrs)
 
     def __getattr__(cls, name: str) -> FlagValue:
@@ -214,8 +220,7 @@ class Intents(Flag):
 
     @classmethod
     def all(cls):
-        kwargs = {flag.name: True for flag in cls}
-        return cls(**kwargs)
+        return cls(cls.__all_value__)
 
     @classmethod
     def default(cls):
@@ -273,8 +278,7 @@ class Permissions(Flag):
 
     @classmethod
     def all(cls):
-        kwargs = {flag.name: True for flag in cls}
-        return cls(**kwargs)
+        return cls(cls.__all_value__)
 
     @classmethod
     def none(cls):
@@ -29,18 +29,36 @@ from .threads import Thread
 from .attachments import CDNAsset
 from .flags import Permissions, SystemChannelFlags
 from .stickers import Sticker
+from .member import Member
+from .role import Role
 
 if TYPE_CHECKING:
     from ..state import State
     from .channel import CategoryChannel, Channel, TextChannel, VoiceChannel
-    from .member import Member
-    from .role import Role
     from .user import User
 
     GuildChannels = Union[TextChannel, VoiceChannel, CategoryChannel, Channel]
 
 __all__ = ("Guild",)
 
+_ALL_PERMISSIONS = Permissions.__all_value__
+_overwrite_types: Dict[type, int] = {Role: 0, Member: 1}
+
+
+def _overwrite_type(target: Union[Member, Role]) -> int:
+    # Looking the exact class up first avoids a slow failing isinstance check against Snowflake.
+    type = _overwrite_types.get(target.__class__)
+    if type is not None:
+        return type
+
+    if isinstance(target, Member):
+        return 1
+
+    if isinstance(target, Role):
+        return 0
+
+    raise TypeError("Target must be a Member or Role")
+
 
 class BanEntry(NamedTuple):
     user: User
@@ -61,6 +79,7 @@ class Guild:
 
         self._state = state
         self._data = data
+        self._id = int(data["id"])
 
     def __repr__(self) -> str:
         return f"<Guild id={self.id}>"
@@ -95,24 +114,21 @@ class Guild:
         if not base:
             return None
 
-        permission_overwrites = []
-        for target, overwrite in base.items():
-            if not isinstance(target, (Member, Role)):
-                raise TypeError("Target must be a Member or Role")
-
+        for overwrite in base.values():
             if not isinstance(overwrite, Permissions):
                 raise TypeError("Overwrite must be a Permissions instance")
 
-            allow, deny = overwrite.to_overwrite_pair()
-
-            ow = {
+        # Every permission that isn't allowed is denied, so the pair can be built
+        # straight from the value instead of going through ``to_overwrite_pair``.
+        permission_overwrites = [
+            {
+                "type": _overwrite_type(target),
                 "id": target.id,
-                "type": 1 if isinstance(target, Member) else 0,
-                "allow": allow.value,
-                "deny": deny.value,
+                "allow": overwrite.value,
+                "deny": _ALL_PERMISSIONS & ~overwrite.value,
             }
-
-            permission_overwrites.append(ow)
+            for target, overwrite in base.items()
+        ]
 
         return permission_overwrites
 
@@ -990,7 +1006,7 @@ class Guild:
     @property
     def id(self) -> int:
         """The ID of the guild."""
-        return int(self._data["id"])
+        return self._id
 
     @property
     def name(self) -> str:
@@ -1088,7 +1104,7 @@ class Guild:
         """
         The list of categories instances belonging to the guild.
         """
-        return [channel for channel in self.channels if isinstance(channel, CategoryChannel)]
+        return [channel for channel in self._channels.values() if channel.type is ChannelType.CATEGORY]  # type: ignore
 
     @property
     def default_role(self) -> Role:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, Dict, List, Optional, Union
+from operator import methodcaller
 
 from lefi.utils.payload import update_payload
 
@@ -18,6 +19,8 @@ if TYPE_CHECKING:
 
 __all__ = ("Interaction",)
 
+_to_dict = methodcaller("to_dict")
+
 
 class Interaction:
     """
@@ -161,8 +164,8 @@ class Interaction:
         payload = update_payload(
             {},
             content=content,
-            components=[row.to_dict() for row in rows] if rows is not None else None,
-            embeds=[embed.to_dict() for embed in embeds],
+            components=list(map(_to_dict, rows)) if rows is not None else None,
+            embeds=list(map(_to_dict, embeds)),
             **kwargs,
         )
 
@@ -210,8 +213,8 @@ class Interaction:
         payload = update_payload(
             {},
             content=content,
-            components=[row.to_dict() for row in rows] if rows is not None else None,
-            embeds=[embed.to_dict() for embed in embeds],
+            components=list(map(_to_dict, rows)) if rows is not None else None,
+            embeds=list(map(_to_dict, embeds)),
         )
 
         if rows is not None and payload.get("components"):
@@ -281,8 +284,8 @@ class Interaction:
         payload = update_payload(
             {},
             content=content,
-            components=[row.to_dict() for row in rows] if rows is not None else None,
-            embeds=[embed.to_dict() for embed in embeds],
+            components=list(map(_to_dict, rows)) if rows is not None else None,
+            embeds=list(map(_to_dict, embeds)),
         )
 
         if rows is not None and payload.get("components"):
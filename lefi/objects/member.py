@@ -16,6 +16,8 @@ if TYPE_CHECKING:
 
 __all__ = ("Member",)
 
+_ADMINISTRATOR = int(Permissions.administrator)
+
 
 class Member(User):
     """Represents a member of a guild."""
@@ -212,18 +214,18 @@ class Member(User):
     @property
     def permissions(self) -> Permissions:
         """The permissions of the member."""
-        base = Permissions.none()
-
         if self._guild.owner_id == self.id:
             return Permissions.all()
 
-        for role in self.roles:
-            base |= role.permissions
+        # The role bits are folded as plain ints and only wrapped once at the end.
+        value = 0
+        for role in self._roles.values():
+            value |= int(role._data["permissions"])
 
-        if base.value & Permissions.administrator:
+        if value & _ADMINISTRATOR:
             return Permissions.all()
 
-        return base
+        return Permissions(value)
 
     @property
     def guild_avatar(self) -> Optional[CDNAsset]:
@@ -2,12 +2,13 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Dict, List, Optional, Union
 import datetime
+from operator import methodcaller
 
 from lefi.utils.payload import update_payload
 
-from ..utils import Snowflake
+from ..utils import Snowflake, to_snowflake
 from .embed import Embed
-from .threads import Thread
+from .threads import AUTO_ARCHIVE_DURATIONS, Thread
 from .attachments import Attachment
 from .components import ActionRow
 from .mentions import AllowedMentions
@@ -23,6 +24,8 @@ if TYPE_CHECKING:
 
 __all__ = ("Message", "DeletedMessage")
 
+_to_dict = methodcaller("to_dict")
+
 
 class DeletedMessage:
     """Represents a deleted message.
@@ -45,7 +48,7 @@ class DeletedMessage:
     def __init__(self, data: dict) -> None:
         self.id = int(data["id"])
         self.channel_id = int(data["channel_id"])
-        self.guild_id = int(data["guild_id"]) if "guild_id" in data else None
+        self.guild_id = to_snowflake(data, "guild_id")
 
 
 class Message:
@@ -55,6 +58,7 @@ class Message:
         self._channel = channel
         self._state = state
         self._data = data
+        self._id = int(data["id"])
 
         self._pinned = data.get("pinned", False)
 
@@ -104,9 +108,9 @@ class Message:
         """
         req = self._state.client.http.edit_message
 
-        embeds_ = [e.to_dict() for e in embeds] if embeds else []
-        actionrows_ = [r.to_dict() for r in rows] if rows else []
-        attachments_ = [a.to_dict() for a in attachments] if attachments else []
+        embeds_ = list(map(_to_dict, embeds)) if embeds else []
+        actionrows_ = list(map(_to_dict, rows)) if rows else []
+        attachments_ = list(map(_to_dict, attachments)) if attachments else []
         mentions = allowed_mentions.to_dict() if allowed_mentions else None
 
         data = await req(
@@ -252,9 +256,8 @@ class Message:
         if not self.guild:
             raise TypeError("Cannot a create thread in a DM channel.")
 
-        if auto_archive_duration is not None:
-            if auto_archive_duration not in (60, 1440, 4320, 10080):
-                raise ValueError("auto_archive_duration must be 60, 1440, 4320 or 10080")
+        if auto_archive_duration is not None and auto_archive_duration not in AUTO_ARCHIVE_DURATIONS:
+            raise ValueError("auto_archive_duration must be 60, 1440, 4320 or 10080")
 
         data = await self._state.http.start_thread_with_message(
             channel_id=self.channel.id,
@@ -285,7 +288,7 @@ class Message:
     @property
     def id(self) -> int:
         """The id of the message."""
-        return int(self._data["id"])
+        return self._id
 
     @property
     def created_at(self) -> datetime.datetime:
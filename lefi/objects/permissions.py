@@ -13,6 +13,11 @@ class Overwrite:
 
     def __init__(self, data: dict) -> None:
         self._data = data
+        self._id = int(data["id"])
+
+        # The raw bits are what permission calculations work with, so they're parsed once here.
+        self._allow = int(data.get("allow", 0))
+        self._deny = int(data.get("deny", 0))
 
     def __repr__(self) -> str:
         return f"<Overwrite id={self.id}>"
@@ -20,7 +25,7 @@ class Overwrite:
     @property
     def id(self) -> int:
         """The id of the overwrite."""
-        return int(self._data["id"])
+        return self._id
 
     @property
     def type(self) -> OverwriteType:
@@ -30,9 +35,9 @@ class Overwrite:
     @property
     def allow(self) -> Permissions:
         """Values of all allowed permissions."""
-        return Permissions(int(self._data.get("allow", 0)))
+        return Permissions(self._allow)
 
     @property
     def deny(self) -> Permissions:
         """Value of all denied permissions."""
-        return Permissions(int(self._data.get("deny", 0)))
+        return Permissions(self._deny)
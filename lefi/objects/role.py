@@ -18,6 +18,7 @@ class PartialRole(Snowflake):
     def __init__(self, data: dict, guild: Guild):
         self._data = data
         self._guild = guild
+        self._id = int(data["id"])
 
     @property
     def guild(self) -> Guild:
@@ -32,7 +33,7 @@ class PartialRole(Snowflake):
     @property
     def id(self) -> int:  # type: ignore
         """The id of the role."""
-        return int(self._data["id"])
+        return self._id
 
 
 class Role(Snowflake):
@@ -42,6 +43,7 @@ class Role(Snowflake):
         self._state = state
         self._data = data
         self._guild = guild
+        self._id = int(data["id"])
 
     def __repr__(self) -> str:
         return f"<Role id={self.id} name={self.name!r} position={self.position}>"
@@ -123,7 +125,7 @@ class Role(Snowflake):
     @property
     def id(self) -> int:  # type: ignore
         """The id of the role."""
-        return int(self._data["id"])
+        return self._id
 
     @property
     def name(self) -> str:
@@ -17,6 +17,9 @@ if TYPE_CHECKING:
 
 __all__ = ("Thread", "ThreadMember")
 
+# The only durations, in minutes, that discord accepts for auto archiving a thread.
+AUTO_ARCHIVE_DURATIONS = frozenset((60, 1440, 4320, 10080))
+
 
 class Thread(BaseTextChannel):
     """Represents a thread."""
@@ -24,16 +27,25 @@ class Thread(BaseTextChannel):
     def __init__(self, state: State, guild: Guild, data: dict) -> None:
         self._state = state
         self._guild = guild
+        self._update(data)
+
+        self._members: Dict[int, ThreadMember] = {}
+
+    def _update(self, data: dict) -> None:
         self._data = data
         self._metadata = data["thread_metadata"]
 
-        self._members: Dict[int, ThreadMember] = {}
+        self._id = int(data["id"])
+        self._name: str = data["name"]
+        self._owner_id = int(data["owner_id"])
+        self._parent_id = to_snowflake(data, "parent_id")
+        self._last_message_id = to_snowflake(data, "last_message_id")
 
     def __repr__(self) -> str:
-        return f"<Thread id={self.id} name={self.name!r} owner_id={self.owner_id}>"
+        return f"<Thread id={self._id} name={self._name!r} owner_id={self._owner_id}>"
 
     def _copy(self) -> Thread:
-        copy = self.__class__(self._state, self.guild, self._data)
+        copy = self.__class__(self._state, self._guild, self._data)
         copy._members = self._members.copy()
 
         return copy
@@ -41,32 +53,32 @@ class Thread(BaseTextChannel):
     @property
     def parent_id(self) -> Optional[int]:
         """The id of the parent channel."""
-        return to_snowflake(self._data, "parent_id")
+        return self._parent_id
 
     @property
     def parent(self) -> Optional[TextChannel]:
         """The parent channel of the thread."""
-        return self._guild.get_channel(self.parent_id)  # type: ignore
+        return self._guild.get_channel(self._parent_id)  # type: ignore
 
     @property
     def guild(self) -> Guild:
         """The guild which the thread belongs to."""
-        return self.guild
+        return self._guild
 
     @property
     def name(self) -> str:
         """The name of the thread."""
-        return self._data["name"]
+        return self._name
 
     @property
     def id(self) -> int:  # type: ignore
         """The id of the thread."""
-        return int(self._data["id"])
+        return self._id
 
     @property
     def owner_id(self) -> int:
         """The id of the owner of the thread."""
-        return int(self._data["owner_id"])
+        return self._owner_id
 
     @property
     def owner(self) -> Optional[Member]:
@@ -86,12 +98,12 @@ class Thread(BaseTextChannel):
     @property
     def last_message_id(self) -> Optional[int]:
         """The in of the last message in the thread"""
-        return to_snowflake(self._data, "last_message_id")
+        return self._last_message_id
 
     @property
     def last_message(self) -> Optional[Message]:
         """The last message in the thread."""
-        return self._state.get_message(self.last_message_id)  # type: ignore
+        return self._state.get_message(self._last_message_id)  # type: ignore
 
     @property
     def members(self) -> List[ThreadMember]:
@@ -27,6 +27,7 @@ class User(Messageable, Snowflake):
     def __init__(self, state: State, data: Dict) -> None:
         self._state = state
         self._data = data
+        self._id = int(data["id"])
 
         self._channel: Optional[DMChannel] = None
 
@@ -86,7 +87,7 @@ class User(Messageable, Snowflake):
     @property
     def id(self) -> int:  # type: ignore
         """The id of the user."""
-        return int(self._data["id"])
+        return self._id
 
     @property
     def bot(self) -> bool:
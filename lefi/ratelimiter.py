@@ -2,23 +2,153 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import TYPE_CHECKING, Any, Optional, Union
+import random
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+
+import aiohttp
 
 from .errors import HTTPException
+from .utils import to_json
 
 if TYPE_CHECKING:
-    from .http import HTTPClient, Route
+    from .http import Bucket, HTTPClient, Route
 
-__all__ = ("Ratelimiter",)
+__all__ = (
+    "BucketState",
+    "Ratelimiter",
+)
 
 logger = logging.getLogger(__name__)
 
 
+class BucketState:
+    """The ratelimit state of a bucket.
+
+    This acts as a token bucket which is seeded and kept in sync with the
+    ``X-RateLimit-*`` headers of every response to a route in the bucket.
+    A token is taken for every request, so up to ``remaining`` requests
+    can be in flight at once before the bucket has to wait for its reset.
+
+    .. warning::
+
+        This class is used internally and isn't meant to be used directly.
+
+    Parameters
+    ----------
+    loop: :class:`asyncio.AbstractEventLoop`
+        The event loop being used
+
+    Attributes
+    ----------
+    loop: :class:`asyncio.AbstractEventLoop`
+        The event loop being used
+
+    lock: :class:`asyncio.Lock`
+        The lock of the bucket. This is held while taking a token, and while
+        waiting for the bucket to reset.
+
+    limit: Optional[:class:`int`]
+        The amount of requests which can be made per reset.
+        This is ``None`` until the first response is received.
+
+    remaining: Optional[:class:`int`]
+        The amount of tokens left before the bucket resets.
+        This is ``None`` until the first response is received.
+
+    reset_at: :class:`float`
+        The loop time at which the bucket resets
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop: asyncio.AbstractEventLoop = loop
+        self.lock: asyncio.Lock = asyncio.Lock()
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset_at: float = 0.0
+        self._reset: Optional[str] = None
+
+    def delay(self) -> float:
+        """How long to wait before the bucket can be requested again.
+
+        Returns
+        -------
+        :class:`float`
+            The delay in seconds, ``0`` if a request can be made right away
+        """
+        if self.remaining is not None and self.remaining <= 0:
+            return max(self.reset_at - self.loop.time(), 0.0)
+
+        return 0.0
+
+    async def wait(self) -> None:
+        """Waits for the bucket to reset if it's out of tokens.
+
+        Once the bucket has reset its tokens are refilled up to :attr:`limit`.
+        This should be called while holding :attr:`lock`.
+        """
+        if self.remaining is None or self.remaining > 0:
+            return
+
+        if delay := self.delay():
+            logger.info(f"BUCKET DEPLETED: RETRY: {delay}s")
+            await asyncio.sleep(delay)
+
+        self.remaining = self.limit
+
+    def take(self) -> bool:
+        """Takes a token from the bucket.
+
+        Returns
+        -------
+        :class:`bool`
+            ``False`` if the limits of the bucket aren't known yet, in which case
+            the request should be made while holding :attr:`lock`
+        """
+        if self.remaining is None:
+            return False
+
+        self.remaining -= 1
+        return True
+
+    def update(self, headers: Any) -> None:
+        """Updates the state from the headers of a response.
+
+        Responses can come back out of order, so within the same reset window
+        the lowest amount of remaining tokens is kept.
+
+        Parameters
+        ----------
+        headers: :class:`multidict.CIMultiDictProxy`
+            The headers of the response
+        """
+        if (limit := headers.get("X-RateLimit-Limit")) is not None:
+            self.limit = int(limit)
+
+        if (remaining := headers.get("X-RateLimit-Remaining")) is not None:
+            reset = headers.get("X-RateLimit-Reset")
+
+            if self.remaining is not None and reset == self._reset:
+                self.remaining = min(self.remaining, int(remaining))
+            else:
+                self.remaining = int(remaining)
+                self._reset = reset
+
+        if (reset_after := headers.get("X-RateLimit-Reset-After")) is not None:
+            self.reset_at = self.loop.time() + float(reset_after)
+
+
 class Ratelimiter:
     """A class which acts as a ratelimiter for the API.
 
-    This class is used to create semaphores and handle said semaphores.
-    This is used for concurrent requests.
+    Before a request is made this waits on the global ratelimit, the bucket of the route
+    and the client's concurrency limit. Requests which get ratelimited or hit a
+    temporary server error are retried, the latter with a jittered exponential backoff.
+
+    Only idempotent methods are retried on any of :attr:`RETRY_STATUSES`. Other methods,
+    such as ``POST``, are only retried on :attr:`UNPROCESSED_STATUSES`. Those statuses are
+    returned when discord couldn't be reached or couldn't take the request. A ``500`` or a
+    ``504`` may come back after the request was already processed, the latter when the gateway
+    gave up waiting on it, and retrying them could e.g. send a message twice.
 
     .. warning::
 
@@ -37,20 +167,19 @@ class Ratelimiter:
         The method to request with E.g `POST` and `GET`
 
     **kwargs: Any
-        Extra options to pass to :meth:`aiohttp.ClientSession.request`
+        Extra options to pass to :meth:`aiohttp.ClientSession.request`.
+        A ``form`` may be passed as a list of fields, which is sent
+        along with the ``json`` payload as :class:`aiohttp.FormData`.
 
     Attributes
     ----------
     loop: :class:`asyncio.AbstractEventLoop`
         The event loop being used
 
-    global_: :class:`asyncio.Event`
-        The global ratelimit event
-
     http: :class:`.HTTPClient`
         The HTTPClient being used
 
-    bucket: :class:`str`
+    bucket: :class:`tuple`
         The :class:`.Route`'s bucket
 
     route: :class:`.Route`
@@ -59,120 +188,220 @@ class Ratelimiter:
     method: :class:`str`
         The method to request with
 
-    kwargs: Any
-        Extra options passed to :class:`.Ratelimiter`'s constructor
+    form: Optional[List[:class:`dict`]]
+        The form fields to send, if any
 
-    return_data: Union[:class:`dict`, :class:`str`]
-        The returned data after requesting is finished
+    payload_json: Optional[:class:`str`]
+        The serialized ``json`` payload to send along with the form, if any
 
-    error_return: Optional[HTTPException]:
-        Same as ``return_data`` except for errors
+    kwargs: Any
+        Extra options passed to :class:`.Ratelimiter`'s constructor
     """
 
+    MAX_RETRIES: int = 5
+    RETRY_STATUSES = frozenset((500, 502, 503, 504))
+    UNPROCESSED_STATUSES = frozenset((502, 503))
+    IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "PUT", "PATCH", "DELETE"))
+
     def __init__(self, http: HTTPClient, route: Route, method: str, **kwargs) -> None:
         self.loop: asyncio.AbstractEventLoop = http.loop
-        self.global_: asyncio.Event = asyncio.Event()
         self.http: HTTPClient = http
-        self.bucket: str = route.bucket
+        self.bucket: Bucket = route.bucket
         self.route: Route = route
         self.method: str = method
+        self.form: Optional[List[Dict[str, Any]]] = kwargs.pop("form", None)
+        self.payload_json: Optional[str] = None
+
+        # The payload is serialized once here so retries resend the same body.
+        payload = kwargs.pop("json", None)
+        if self.form:
+            self.payload_json = to_json(payload) if payload else None
+        elif payload is not None:
+            kwargs["data"] = to_json(payload).encode()
+            kwargs.setdefault("headers", {})["Content-Type"] = "application/json"
+
         self.kwargs = kwargs
 
-        self.return_data: Union[dict, str]
-        self.error_return: Optional[HTTPException] = None
-        self.global_.set()
+        self._positions: Dict[int, int] = {}
+        for field in self.form or []:
+            value = field["value"]
+            if hasattr(value, "seek") and hasattr(value, "tell"):
+                self._positions[id(value)] = value.tell()
+
+    def get_state(self) -> BucketState:
+        """Gets the state of the route's bucket.
+
+        The state is shared between routes with the same bucket
+        and cached on the route once it is looked up.
+
+        Returns
+        -------
+        :class:`.BucketState`
+            The state of the bucket
+        """
+        state = self.route.state
+        if state is None:
+            state = self.http.buckets.get(self.bucket)
+            if state is None:
+                state = self.http.buckets[self.bucket] = BucketState(self.loop)
+
+            self.route.state = state
+
+        return state
 
-    async def set_semaphore(self) -> asyncio.Semaphore:
-        """Sets the semaphore for the bucket.
+    def build_kwargs(self) -> Dict[str, Any]:
+        """Builds the kwargs for one attempt at the request.
+
+        If there is a form, a new multipart body is built
+        and its files are rewound so the request can be retried.
 
         Returns
         -------
-        :class:`asyncio.Semaphore`
-            The newly created semaphore set on the bucket
+        :class:`dict`
+            The kwargs to pass to :meth:`aiohttp.ClientSession.request`
         """
-        if semaphore := self.http.semaphores.get(self.bucket):
-            return semaphore
+        if not self.form:
+            return self.kwargs
+
+        kwargs = self.kwargs.copy()
+        writer = aiohttp.MultipartWriter("form-data", boundary=self.http.next_boundary())
+
+        if self.payload_json is not None:
+            part = aiohttp.get_payload(self.payload_json)
+            part.set_content_disposition("form-data", name="payload_json")
+            writer.append_payload(part)
 
-        resp = await self.http.session.request(
-            "HEAD",
-            self.route.url,
-            headers={"Authorization": f"Bot {self.http.token}"},
-        )
-        semaphore = asyncio.Semaphore(int(resp.headers.get("X-Ratelimit-Limit", 1)))
-        self.http.semaphores[self.bucket] = semaphore
+        for params in self.form:
+            value = params["value"]
+            if (position := self._positions.get(id(value))) is not None:
+                value.seek(position)
 
-        return semaphore
+            headers = {"Content-Type": params["content_type"]} if "content_type" in params else None
+            part = aiohttp.get_payload(value, headers=headers)
+            if (filename := params.get("filename")) is not None:
+                part.set_content_disposition("form-data", name=params["name"], filename=filename)
+            else:
+                part.set_content_disposition("form-data", name=params["name"])
+            writer.append_payload(part)
 
-    async def release(self, semaphore: asyncio.Semaphore, delay: float) -> None:
-        """Releases the semaphore after a delay.
+        kwargs["data"] = writer
+        return kwargs
+
+    async def send(self, state: BucketState) -> Tuple[aiohttp.ClientResponse, Union[dict, str]]:
+        """Sends the request and updates the bucket from the response.
 
         Parameters
         ----------
-        semaphore: :class:`asyncio.Semaphore`
-            The semaphore to release after a delay
+        state: :class:`.BucketState`
+            The state of the route's bucket
 
-        delay: :class:`float`
-            The time to wait in seconds before releasing
+        Returns
+        -------
+        Tuple[:class:`aiohttp.ClientResponse`, Union[:class:`dict`, :class:`str`]]
+            The response and its data
+        """
+        # The response is released as soon as its body is read, so the connection goes
+        # back to the pool before the bucket is updated.
+        async with self.http.concurrency:
+            async with self.http.session.request(self.method, self.route.url, **self.build_kwargs()) as resp:
+                data = await self.http.json_or_text(resp)
+
+        state.update(resp.headers)
+        return resp, data
+
+    def should_retry(self, status: int) -> bool:
+        """Checks if a request which failed with a server error should be retried.
+
+        Parameters
+        ----------
+        status: :class:`int`
+            The status of the response
+
+        Returns
+        -------
+        :class:`bool`
+            Whether or not the request should be retried
         """
-        await asyncio.sleep(delay)
-        semaphore.release()
+        if self.method.upper() in self.IDEMPOTENT_METHODS:
+            return status in self.RETRY_STATUSES
+
+        return status in self.UNPROCESSED_STATUSES
 
     def global_ratelimit_set(self, delay: float) -> None:
         """Sets the global ratelimit.
 
         This is used when the handler encounters a global ratelimit.
+        Every request waits until the delay is over.
 
         Parameters
         ----------
         delay: :class:`float`
             How long in seconds to wait before setting the event
         """
-        self.loop.call_later(delay, self.global_.set)
+        self.http.global_ratelimit.clear()
+        self.loop.call_later(delay, self.http.global_ratelimit.set)
 
     async def request(self) -> Any:
         """Makes a request to the route.
 
+        Raises
+        ------
+        :exc:`.HTTPException`
+            Something went wrong while making the request, or it
+            was retried too many times
+
         Returns
         -------
         Any
             The returned data from the request
         """
-        semaphore = self.http.semaphores.get(self.bucket, await self.set_semaphore())
-        session = self.http.session
+        state = self.get_state()
+        data: Union[dict, str] = ""
+
+        for attempt in range(self.MAX_RETRIES):
+            await self.http.global_ratelimit.wait()
+
+            async with state.lock:
+                await state.wait()
 
-        await asyncio.gather(self.global_.wait(), semaphore.acquire(), self.route.lock.acquire())
-        resp = await session.request(self.method, self.route.url, **self.kwargs)
-        data = await self.http.json_or_text(resp)
+                # Until the first response comes back the limits of the bucket are
+                # unknown, so only one request is let through to learn them.
+                if not (taken := state.take()):
+                    resp, data = await self.send(state)
 
-        reset_after: float = float(resp.headers.get("X-Ratelimit-Reset-After", 0))
-        remaining: int = int(resp.headers.get("X-Ratelimit-Remaining", 1))
+            if taken:
+                resp, data = await self.send(state)
 
-        if resp.status != 429 and remaining == 0:
-            logger.info(f"BUCKET DEPLETED: {self.bucket} RETRY: {reset_after}s")
-            self.loop.call_later(reset_after, self.route.lock.release)
-            await self.release(semaphore, reset_after)
-            await self.request()
+            if 300 > resp.status >= 200:
+                logger.info(f"{resp.status}: {self.method} ROUTE: {self.route.url} REMAINING: {state.remaining}")
+                return data
 
-        if 300 > resp.status >= 200:
-            logger.info(f"{resp.status}: {self.method} ROUTE: {self.route.url} REMAINING: {remaining}")
-            return data
+            if resp.status == 429 and isinstance(data, dict):
+                retry_after: float = data["retry_after"]
+                logger.info(f"RATELIMITED: {self.method} ROUTE: {self.route.url} RETRY: {retry_after}")
 
-        if resp.status == 429:
-            retry_after: float = data["retry_after"]  # type: ignore
-            logger.info(f"RATELIMITED: {self.method} ROUTE: {self.route.url} RETRY: {retry_after}")
-            if data.get("global", False):  # type: ignore
-                self.global_.clear()
+                if data.get("global", False):
+                    self.global_ratelimit_set(retry_after)
+                else:
+                    await asyncio.sleep(retry_after)
 
-            self.global_ratelimit_set(retry_after)
-            await asyncio.sleep(retry_after)
-            await self.request()
+                continue
+
+            # There's no point in backing off after the last attempt.
+            if self.should_retry(resp.status) and attempt < self.MAX_RETRIES - 1:
+                delay = 2**attempt + random.random()
+                logger.info(f"{resp.status}: {self.method} ROUTE: {self.route.url} RETRY: {delay}s")
+                await asyncio.sleep(delay)
+                continue
 
-        if not 300 > resp.status >= 200:
             logger.info(f"FAILED: {self.method} : ROUTE: {self.route.url} STATUS: {resp.status}")
             raise self.http.ERRORS.get(resp.status, HTTPException)(data)
 
+        logger.info(f"FAILED: {self.method} : ROUTE: {self.route.url} STATUS: {resp.status} RETRIES EXHAUSTED")
+        raise self.http.ERRORS.get(resp.status, HTTPException)(data)
+
     async def __aenter__(self) -> Ratelimiter:
         return self
 
     async def __aexit__(self, *_) -> None:
-        self.http.semaphores.pop(self.bucket, None)
+        pass
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import asyncio
 import collections
+from concurrent.futures import ThreadPoolExecutor
+import os
 from functools import cached_property
 import logging
 from typing import (
@@ -18,6 +20,7 @@ from typing import (
 )
 
 from .objects import (
+    ChannelType,
     CategoryChannel,
     DeletedMessage,
     DMChannel,
@@ -155,6 +158,10 @@ class State:
 
     http: :class:`.HTTPClient`
         The HTTPClient being used by the client
+
+    io_executor: :class:`concurrent.futures.ThreadPoolExecutor`
+        The executor used for blocking file I/O, such as saving attachments.
+        Its size can be set with the ``LEFI_IO_WORKERS`` environment variable
     """
 
     CHANNEL_MAPPING: Dict[
@@ -167,17 +174,20 @@ class State:
             Type[Channel],
         ],
     ] = {
-        0: TextChannel,
-        1: DMChannel,
-        2: VoiceChannel,
-        3: CategoryChannel,
-        5: TextChannel,
+        ChannelType.TEXT: TextChannel,
+        ChannelType.DM: DMChannel,
+        ChannelType.VOICE: VoiceChannel,
+        ChannelType.CATEGORY: CategoryChannel,
+        ChannelType.NEWS: TextChannel,
     }
 
     def __init__(self, client: Client, loop: asyncio.AbstractEventLoop) -> None:
         self.client = client
         self.loop = loop
         self.http = client.http
+        self.io_executor = ThreadPoolExecutor(
+            max_workers=int(os.getenv("LEFI_IO_WORKERS", "16")), thread_name_prefix="lefi-io"
+        )
         self._messages = Cache[Message](1000)
         self._users = Cache[User]()
         self._guilds = Cache[Guild]()
@@ -1418,7 +1428,7 @@ class State:
 
             ows[target] = overwrite  # type: ignore
 
-        channel._overwrites = ows
+        channel._set_overwrites(ows)
 
     def update_guild(self, guild: Guild, data: dict) -> Tuple[Guild, Guild]:
         """Updates a guild
@@ -1467,7 +1477,7 @@ class State:
         """
         before = channel._copy()
 
-        channel._data = data
+        channel._update(data)
         self.create_overwrites(channel)
 
         return before, channel
@@ -1489,10 +1499,7 @@ class State:
             A tuple containing the thread channel before and after updating.
         """
         before = thread._copy()
-        thread._data = data
-
-        if metadata := data.get("metadata"):
-            thread._metadata = metadata
+        thread._update(data)
 
         return before, thread
 
@@ -4,3 +4,4 @@ from .payload import *
 from .search import *
 from .iterators import *
 from .snowflake import *
+from .serialize import *
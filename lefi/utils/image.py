@@ -1,4 +1,7 @@
-import base64
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64  # type: ignore
 
 __all__ = (
     "is_jpeg",
@@ -75,6 +78,8 @@ def bytes_to_data_uri(data: bytes) -> str:
     """
     Convert the given bytes to a URI.
 
+    If ``pybase64`` is installed it is used for the encoding.
+
     Parameters:
         data (bytes): The data to convert.
 
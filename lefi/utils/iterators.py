@@ -5,6 +5,7 @@ import itertools
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Coroutine,
     Dict,
     Generic,
@@ -12,6 +13,7 @@ from typing import (
     Iterator,
     TypeVar,
     List,
+    Optional,
 )
 
 _T = TypeVar("_T")
@@ -37,6 +39,11 @@ def grouper(n: int, iterable: Iterable[T]) -> Iterator[List[T]]:
         yield [item for item in group if item is not None]
 
 
+def _retrieve_exception(task: asyncio.Task) -> None:
+    if not task.cancelled():
+        task.exception()
+
+
 class AsyncIterator(Generic[_T]):
     def __init__(self, coroutine: Coroutine[None, None, Any]) -> None:
         self.coroutine = coroutine
@@ -96,22 +103,99 @@ class MemberIterator(AsyncIterator["Member"]):
 
 
 class ChannelHistoryIterator(AsyncIterator["Message"]):
+    """An iterator over a channel's history.
+
+    Messages are fetched in pages of up to 100. As soon as a page comes back the request
+    for the next one is started, so it is in flight while the current page is consumed.
+    If a ``check`` is given, messages which don't pass it are dropped before they're queued.
+
+    When iteration stops early, the prefetch can be cancelled with :meth:`aclose`,
+    or by using the iterator as an async context manager.
+    """
+
+    PAGE_SIZE: int = 100
+
     def __init__(
         self,
         state: State,
         channel: Messageable,
-        coroutine: Coroutine[None, None, List[Any]],
+        *,
+        limit: int = 50,
+        around: Optional[int] = None,
+        before: Optional[int] = None,
+        after: Optional[int] = None,
+        check: Optional[Callable[[Message], bool]] = None,
     ) -> None:
         self.state = state
         self.channel = channel
-        super().__init__(coroutine)
+        self.limit = limit
+        self.around = around
+        self.before = before
+        self.after = after
+        self.check = check
+        self._next: Optional[asyncio.Task] = None
+        super().__init__(self._fetch_page())
+
+    def _fetch_page(self) -> Coroutine[None, None, List[Any]]:
+        limit = min(self.limit, self.PAGE_SIZE)
+        self.limit -= limit
+
+        return self.state.http.get_channel_messages(
+            self.channel.id, limit=limit, around=self.around, before=self.before, after=self.after
+        )
 
     async def _fill_queue(self) -> None:
-        values = await self.coroutine
+        if self._next is not None:
+            values = await self._next
+            self._next = None
+        else:
+            values = await self.coroutine
 
-        for value in values:
-            message = self.state.create_message(value, self.channel)
-            await self.queue.put(message)
+        # Messages around an id can't be paginated, and a short page means the history ran out.
+        if values and self.limit > 0 and self.around is None and len(values) == self.PAGE_SIZE:
+            if self.after is not None:
+                self.after = max(int(value["id"]) for value in values)
+            else:
+                self.before = min(int(value["id"]) for value in values)
+
+            self._next = self.loop.create_task(self._fetch_page())
+            # Retrieving the exception here keeps an abandoned prefetch from being reported
+            # as never retrieved, awaiting the task still raises it as usual.
+            self._next.add_done_callback(_retrieve_exception)
+
+        create_message, channel = self.state.create_message, self.channel
+        messages: Iterable[Message] = (create_message(value, channel) for value in values)
+
+        # Without a check there's nothing to filter, so not even a per message call is made.
+        if self.check is not None:
+            messages = filter(self.check, messages)
+
+        for message in messages:
+            self.queue.put_nowait(message)
+
+    async def next(self) -> Message:
+        # A page can be filtered out entirely, so keep going until something is queued.
+        try:
+            while not self.filled or (self._next is not None and self.queue.empty()):
+                await self._fill_queue()
+                self.filled = True
+        except BaseException:
+            await self.aclose()
+            raise
+
+        return self.queue.get_nowait()
+
+    async def aclose(self) -> None:
+        """Cancels the prefetch of the next page, if there is one."""
+        if self._next is not None:
+            self._next.cancel()
+            self._next = None
+
+    async def __aenter__(self) -> ChannelHistoryIterator:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
 
 
 class AuditLogIterator(AsyncIterator["AuditLogEntry"]):
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    HAS_ORJSON = False
+else:
+    HAS_ORJSON = True
+
+__all__ = (
+    "to_json",
+    "from_json",
+)
+
+
+def to_json(obj: Any) -> str:
+    """
+    Serialize the given object to a JSON string.
+
+    Uses ``orjson`` if it is installed, falling back to the stdlib ``json`` module.
+
+    Parameters:
+        obj (Any): The object to serialize.
+
+    Returns:
+        The JSON string.
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(obj).decode("utf-8")
+
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def from_json(data: Union[str, bytes]) -> Any:
+    """
+    Deserialize the given JSON string or bytes.
+
+    Uses ``orjson`` if it is installed, falling back to the stdlib ``json`` module.
+
+    Parameters:
+        data (Union[str, bytes]): The JSON to deserialize.
+
+    Returns:
+        The deserialized object.
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+
+    return json.loads(data)
@@ -12,12 +12,13 @@ from typing import (
     cast,
 )
 import struct
-import nacl.secret
 import enum
 
 from . import _opus
 
 if TYPE_CHECKING:
+    import nacl.secret
+
     from .wsclient import VoiceWebSocketClient
     from .client import VoiceClient
     from .listeners import AudioListener
@@ -157,6 +158,10 @@ class VoiceProtocol(asyncio.streams.FlowControlMixin, asyncio.DatagramProtocol):
         if self._secret_box:
             return self._secret_box
 
+        # PyNaCl is only loaded once a voice connection needs it,
+        # so gateway-only bots don't pay for it on import.
+        import nacl.secret
+
         self._secret_box = nacl.secret.SecretBox(bytes(self.websocket.secret_key))
         return self._secret_box
 
@@ -186,7 +191,9 @@ class VoiceProtocol(asyncio.streams.FlowControlMixin, asyncio.DatagramProtocol):
         return nonce
 
     def generate_xsalsa20_poly1305_suffix_nonce(self) -> bytes:
-        return nacl.secret.random(24)
+        import nacl.utils
+
+        return nacl.utils.random(24)
 
     def generate_xsalsa20_poly1305_lite_nonce(self) -> bytes:
         nonce = bytearray(24)
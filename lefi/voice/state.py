@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Dict, Optional
 
+from ..utils import to_snowflake
+
 if TYPE_CHECKING:
     from ..objects import Guild, VoiceChannel, User
     from ..state import State
@@ -27,7 +29,7 @@ class VoiceState:
 
     @property
     def channel_id(self) -> Optional[int]:
-        return int(self._data["channel_id"]) if self._data["channel_id"] else None
+        return to_snowflake(self._data, "channel_id")
 
     @property
     def channel(self) -> Optional[VoiceChannel]:
@@ -35,11 +37,12 @@ class VoiceState:
 
     @property
     def guild_id(self) -> Optional[int]:
-        return int(self._data["guild_id"]) if self._data["guild_id"] else None
+        return to_snowflake(self._data, "guild_id")
 
     @property
     def guild(self) -> Optional[Guild]:
-        return self._state.get_guild(self.guild_id) if self.guild_id else None
+        guild_id = self.guild_id
+        return self._state.get_guild(guild_id) if guild_id else None
 
     @property
     def session_id(self) -> str:
@@ -0,0 +1,65 @@
+import asyncio
+import os
+
+import pytest
+
+import lefi
+
+
+class FakeHTTP:
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.cancelled = 0
+
+    async def read_stream(self, url, *, timeout=None):
+        if self.fail and url.endswith("/broken"):
+            raise RuntimeError("download failed")
+
+        try:
+            for chunk in (url.encode(), b"\n"):
+                await asyncio.sleep(0.01)
+                yield chunk
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+
+
+class FakeState:
+    io_executor = None
+
+    def __init__(self, http: FakeHTTP) -> None:
+        self.http = http
+
+
+def make_attachment(state: FakeState, id: int, filename: str = "image.png", url: str = "") -> lefi.Attachment:
+    data = {
+        "id": str(id),
+        "filename": filename,
+        "size": 0,
+        "url": url or f"https://cdn.discordapp.com/attachments/{id}",
+        "proxy_url": "",
+    }
+    return lefi.Attachment(state, data)  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_gather_save_keeps_attachments_with_the_same_filename(tmp_path) -> None:
+    state = FakeState(FakeHTTP())
+    attachments = [make_attachment(state, 1), make_attachment(state, 2), make_attachment(state, 1)]
+
+    await lefi.Attachment.gather_save(attachments, tmp_path)
+
+    assert sorted(os.listdir(tmp_path)) == ["1_image.png", "2_image.png"]
+    assert (tmp_path / "2_image.png").read_bytes() == b"https://cdn.discordapp.com/attachments/2\n"
+
+
+@pytest.mark.asyncio
+async def test_gather_save_cancels_downloads_when_one_fails(tmp_path) -> None:
+    http = FakeHTTP(fail=True)
+    state = FakeState(http)
+    attachments = [make_attachment(state, 1), make_attachment(state, 2), make_attachment(state, 3, url="/broken")]
+
+    with pytest.raises(RuntimeError, match="download failed"):
+        await lefi.Attachment.gather_save(attachments, tmp_path)
+
+    assert http.cancelled == 2
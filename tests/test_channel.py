@@ -0,0 +1,139 @@
+import pytest
+
+import lefi
+
+
+class FakeGuild:
+    def __init__(self, id: int) -> None:
+        self.id = id
+
+
+def test_unknown_channel_type() -> None:
+    data = {"id": "1", "name": "forum", "type": 15, "position": 0}
+    channel = lefi.Channel(None, data, FakeGuild(10))  # type: ignore
+
+    assert channel.type == 15 and not isinstance(channel.type, lefi.ChannelType)
+
+
+def test_known_channel_type() -> None:
+    data = {"id": "1", "name": "general", "type": 0, "position": 0}
+    channel = lefi.TextChannel(None, data, FakeGuild(10))  # type: ignore
+
+    assert channel.type is lefi.ChannelType.TEXT
+
+
+def test_channel_with_missing_fields() -> None:
+    # Group DMs have no position and may not have a name either.
+    data = {"id": "1", "type": 3, "recipients": []}
+    channel = lefi.Channel(None, data, FakeGuild(10))  # type: ignore
+
+    assert channel.name is None and channel.position is None
+    assert repr(channel) == "<Channel name=None id=1 position=None type=3>"
+
+
+class FakeHTTP:
+    async def delete_channel_permissions(self, channel_id: int, overwrite_id: int) -> None:
+        pass
+
+
+class FakeState:
+    http = FakeHTTP()
+
+    def add_user(self, data: dict) -> None:
+        pass
+
+
+SEND_MESSAGES = int(lefi.Permissions.send_messages)
+VIEW_CHANNEL = int(lefi.Permissions.view_channel)
+
+
+def make_permissions_setup():
+    state = FakeState()
+    guild = FakeGuild(10)
+    guild.owner_id = 1  # type: ignore
+
+    everyone = lefi.Role(state, {"id": "10", "permissions": str(VIEW_CHANNEL)}, guild)  # type: ignore
+    muted = lefi.Role(state, {"id": "20", "permissions": "0"}, guild)  # type: ignore
+
+    member = lefi.Member(state, {"user": {"id": "2"}, "roles": []}, guild)  # type: ignore
+    member._roles = {everyone.id: everyone}
+
+    data = {"id": "3", "name": "general", "type": 0, "position": 0}
+    channel = lefi.TextChannel(state, data, guild)  # type: ignore
+
+    return channel, member, everyone, muted
+
+
+def overwrite(target, allow: int = 0, deny: int = 0) -> lefi.Overwrite:
+    return lefi.Overwrite({"id": str(target.id), "type": 0, "allow": str(allow), "deny": str(deny)})
+
+
+@pytest.mark.asyncio
+async def test_permissions_follow_overwrite_changes() -> None:
+    channel, member, everyone, _ = make_permissions_setup()
+    assert not channel.permissions_for(member).send_messages
+
+    channel._set_overwrites({everyone: overwrite(everyone, allow=SEND_MESSAGES)})
+    assert channel.permissions_for(member).send_messages
+
+    channel._set_overwrites({everyone: overwrite(everyone, deny=VIEW_CHANNEL)})
+    assert not channel.permissions_for(member).view_channel
+
+    await channel.delete_permission(everyone)
+    assert channel.permissions_for(member).view_channel
+
+
+def test_permissions_follow_role_permission_changes() -> None:
+    channel, member, everyone, _ = make_permissions_setup()
+    channel._set_overwrites({everyone: overwrite(everyone, deny=VIEW_CHANNEL)})
+
+    assert not channel.permissions_for(member).send_messages
+
+    # This is what a GUILD_ROLE_UPDATE does to the cached role.
+    everyone._data = {"id": "10", "permissions": str(VIEW_CHANNEL | SEND_MESSAGES)}
+    permissions = channel.permissions_for(member)
+
+    assert permissions.send_messages and not permissions.view_channel
+
+
+def test_permissions_follow_member_role_changes() -> None:
+    channel, member, everyone, muted = make_permissions_setup()
+    channel._set_overwrites(
+        {
+            everyone: overwrite(everyone, allow=SEND_MESSAGES),
+            muted: overwrite(muted, deny=SEND_MESSAGES),
+        }
+    )
+
+    assert channel.permissions_for(member).send_messages
+
+    member._roles[muted.id] = muted
+    assert not channel.permissions_for(member).send_messages
+
+    del member._roles[muted.id]
+    assert channel.permissions_for(member).send_messages
+
+
+def test_parent_follows_the_guild_cache() -> None:
+    class Guild(FakeGuild):
+        def __init__(self, id: int) -> None:
+            super().__init__(id)
+            self.channels: dict = {}
+
+        def get_channel(self, channel_id: int):
+            return self.channels.get(channel_id)
+
+    guild = Guild(10)
+    category = lefi.CategoryChannel(None, {"id": "4", "name": "category", "type": 4}, guild)  # type: ignore
+    guild.channels[category.id] = category
+
+    data = {"id": "5", "name": "general", "type": 0, "parent_id": "4"}
+    channel = lefi.TextChannel(None, data, guild)  # type: ignore
+    assert channel.parent is category
+
+    replacement = category._copy()
+    guild.channels[category.id] = replacement
+    assert channel.parent is replacement
+
+    del guild.channels[category.id]
+    assert channel.parent is None
@@ -0,0 +1,178 @@
+import asyncio
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from lefi.errors import HTTPException
+from lefi.http import HTTPClient
+
+
+class FakeResponse:
+    def __init__(self, status: int = 200, data: Any = None) -> None:
+        self.status = status
+        self.data = {} if data is None else data
+        self.headers: Dict[str, str] = {}
+
+    async def __aenter__(self) -> "FakeResponse":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        pass
+
+    async def json(self, *, loads: Any) -> Any:
+        return self.data
+
+
+class FakeSession:
+    closed = False
+
+    def __init__(self, *responses: FakeResponse) -> None:
+        self.responses = list(responses)
+        self.requests: List[Dict[str, Any]] = []
+
+    # Mirrors the keyword arguments of aiohttp.ClientSession.request that the client uses,
+    # so anything else leaking through fails the same way it does against aiohttp.
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        data: Any = None,
+        headers: Optional[dict] = None,
+        params: Optional[dict] = None,
+        timeout: Any = None,
+    ) -> FakeResponse:
+        self.requests.append({"method": method, "url": url, "data": data})
+        return self.responses.pop(0) if self.responses else FakeResponse()
+
+
+def make_client(*responses: FakeResponse, token: str = "token") -> HTTPClient:
+    http = HTTPClient(token, asyncio.get_running_loop())
+    http.session = FakeSession(*responses)  # type: ignore
+    return http
+
+
+@pytest.mark.asyncio
+async def test_command_routes_are_not_shared_between_clients() -> None:
+    first, second = make_client(token="first"), make_client(token="second")
+
+    await first.get_global_application_commands(1)
+    await second.get_global_application_commands(1)
+
+    (first_state,) = first.buckets.values()
+    (second_state,) = second.buckets.values()
+    assert first_state is not second_state
+
+
+@pytest.mark.asyncio
+async def test_remove_guild_member() -> None:
+    http = make_client(FakeResponse(204, ""))
+    await http.remove_guild_member(1, 2)
+
+    (request,) = http.session.requests  # type: ignore
+    assert request["method"] == "DELETE" and request["url"].endswith("/guilds/1/members/2")
+
+
+def queue(http: HTTPClient, guild_id: int, *names: str) -> None:
+    for name in names:
+        http.queue_guild_application_command(guild_id, name=name, description="description")
+
+
+@pytest.mark.asyncio
+async def test_flush_without_queued_commands_makes_no_request() -> None:
+    http = make_client()
+    queue(http, 2, "other")
+
+    assert await http.flush_guild_application_commands(1, 1) == []
+    assert http.session.requests == [] and 1 not in http.pending_guild_commands  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_flush_sends_queued_commands() -> None:
+    http = make_client(FakeResponse(200, [{"id": "1"}, {"id": "2"}]))
+    queue(http, 1, "first", "second")
+
+    assert await http.flush_guild_application_commands(1, 1) == [{"id": "1"}, {"id": "2"}]
+
+    (request,) = http.session.requests  # type: ignore
+    assert request["method"] == "PUT" and request["url"].endswith("/applications/1/guilds/1/commands")
+    assert b'"first"' in request["data"] and b'"second"' in request["data"]
+    assert http.pending_guild_commands == {}
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_commands_queued() -> None:
+    http = make_client(FakeResponse(400, {"message": "Invalid Form Body", "code": 50035}))
+    queue(http, 1, "first", "second")
+
+    with pytest.raises(HTTPException):
+        await http.flush_guild_application_commands(1, 1)
+
+    assert [command["name"] for command in http.pending_guild_commands[1]] == ["first", "second"]
+
+
+class WebhookClient(HTTPClient):
+    def __init__(self) -> None:
+        super().__init__("token", asyncio.get_running_loop())
+        self.executed: List[Dict[str, Any]] = []
+
+    async def execute_webhook(self, **kwargs: Any) -> int:  # type: ignore
+        self.executed.append(kwargs)
+        return len(self.executed)
+
+
+def embed_message(*embeds: dict, webhook_id: int = 1) -> Dict[str, Any]:
+    return {"webhook_id": webhook_id, "webhook_token": "token", "embeds": list(embeds)}
+
+
+@pytest.mark.asyncio
+async def test_webhook_batch_merges_embed_only_messages() -> None:
+    http = WebhookClient()
+
+    messages = [embed_message({"title": str(i)}) for i in range(3)]
+    assert await http.execute_webhook_batch(messages) == [1]
+
+    assert [embed["title"] for embed in http.executed[0]["embeds"]] == ["0", "1", "2"]
+    # The caller's messages are left as they were.
+    assert messages == [embed_message({"title": str(i)}) for i in range(3)]
+
+
+@pytest.mark.asyncio
+async def test_webhook_batch_splits_at_ten_embeds() -> None:
+    http = WebhookClient()
+
+    await http.execute_webhook_batch([embed_message({"title": str(i)}) for i in range(12)])
+    assert [len(batch["embeds"]) for batch in http.executed] == [10, 2]
+
+
+@pytest.mark.asyncio
+async def test_webhook_batch_splits_at_the_character_limit() -> None:
+    http = WebhookClient()
+
+    # 3000 characters each, then 9 more from the field, which goes over the limit.
+    embed = {"description": "a" * 3000, "fields": [{"name": "name", "value": "value"}]}
+    messages = [embed_message({"description": "a" * 3000}), embed_message(embed), embed_message({"title": "a"})]
+    await http.execute_webhook_batch(messages)
+
+    assert [len(batch["embeds"]) for batch in http.executed] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_webhook_batch_passes_other_messages_through() -> None:
+    http = WebhookClient()
+
+    content = {"webhook_id": 1, "webhook_token": "token", "content": "hi"}
+    messages = [
+        embed_message({"title": "first"}),
+        content,
+        embed_message({"title": "second"}),
+        embed_message({"title": "third"}, webhook_id=2),
+    ]
+    assert await http.execute_webhook_batch(messages) == [1, 2, 3, 4]
+
+    assert http.executed[1] == content
+    assert [batch["embeds"] for batch in http.executed if "embeds" in batch] == [
+        [{"title": "first"}],
+        [{"title": "second"}],
+        [{"title": "third"}],
+    ]
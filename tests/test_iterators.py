@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+
+import lefi
+
+
+class FakeHTTP:
+    def __init__(self) -> None:
+        self.requests = 0
+
+    async def get_channel_messages(self, channel_id, *, limit, around, before, after):
+        self.requests += 1
+        start = before or 1000
+
+        await asyncio.sleep(0)
+        return [{"id": str(start - i - 1)} for i in range(limit)]
+
+
+class FakeState:
+    def __init__(self) -> None:
+        self.http = FakeHTTP()
+
+    def create_message(self, data, channel):
+        return int(data["id"])
+
+
+class FakeChannel:
+    id = 1
+
+
+@pytest.mark.asyncio
+async def test_history_paginates() -> None:
+    state = FakeState()
+    messages = await lefi.utils.ChannelHistoryIterator(state, FakeChannel(), limit=250).all()  # type: ignore
+
+    assert len(messages) == 250 and len(set(messages)) == 250
+    assert state.http.requests == 3
+
+
+@pytest.mark.asyncio
+async def test_history_cancels_prefetch_on_exit() -> None:
+    iterator = lefi.utils.ChannelHistoryIterator(FakeState(), FakeChannel(), limit=250)  # type: ignore
+
+    async with iterator:
+        async for _ in iterator:
+            break
+
+        task = iterator._next
+        assert task is not None
+
+    await asyncio.sleep(0)
+    assert iterator._next is None and task.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_history_cancels_prefetch_on_error() -> None:
+    def check(message: int) -> bool:
+        raise RuntimeError
+
+    iterator = lefi.utils.ChannelHistoryIterator(FakeState(), FakeChannel(), limit=250, check=check)  # type: ignore
+
+    with pytest.raises(RuntimeError):
+        await iterator.all()
+
+    assert iterator._next is None
@@ -0,0 +1,97 @@
+import asyncio
+import datetime
+
+import pytest
+
+from lefi.objects.base import BaseTextChannel
+
+
+class FakeMessage:
+    def __init__(self, id: int, created_at: datetime.datetime) -> None:
+        self.id = id
+        self.created_at = created_at
+
+
+class FakeHTTP:
+    def __init__(self, fail_after=None) -> None:
+        self.fail_after = fail_after
+        self.pages = 0
+        self.bulk_deleted = []
+        self.cancelled = 0
+
+    async def get_channel_messages(self, channel_id, *, limit, around, before, after):
+        self.pages += 1
+        if self.fail_after is not None and self.pages > self.fail_after:
+            raise RuntimeError("history failed")
+
+        start = before or 1000
+        return [{"id": str(start - i - 1)} for i in range(limit)]
+
+    async def bulk_delete_messages(self, channel_id, message_ids):
+        try:
+            await asyncio.sleep(0.05)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+
+        self.bulk_deleted.append(message_ids)
+
+
+class FakeState:
+    def __init__(self, http: FakeHTTP) -> None:
+        self.http = http
+
+    def create_message(self, data, channel):
+        return FakeMessage(int(data["id"]), datetime.datetime.now(datetime.timezone.utc))
+
+
+class FakeChannel(BaseTextChannel):
+    id = 1
+
+    def __init__(self, http: FakeHTTP) -> None:
+        self._state = FakeState(http)  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_purge_bulk_deletes_in_chunks() -> None:
+    http = FakeHTTP()
+    deleted = await FakeChannel(http).purge(limit=250)
+
+    assert len(deleted) == 250
+    assert sorted(map(len, http.bulk_deleted)) == [50, 100, 100]
+
+
+@pytest.mark.asyncio
+async def test_purge_cancels_deletes_when_history_fails() -> None:
+    http = FakeHTTP(fail_after=1)
+
+    with pytest.raises(RuntimeError, match="history failed"):
+        await FakeChannel(http).purge(limit=250)
+
+    # The first chunk was already being deleted when the second page failed.
+    assert http.cancelled == 1 and http.bulk_deleted == []
+
+
+@pytest.mark.asyncio
+async def test_purge_cancels_deletes_when_a_delete_fails() -> None:
+    http = FakeHTTP()
+    channel = FakeChannel(http)
+
+    original = channel.delete_messages
+    calls = 0
+
+    async def delete_messages(messages):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(0)
+            raise RuntimeError("delete failed")
+
+        await original(messages)
+
+    channel.delete_messages = delete_messages  # type: ignore
+
+    with pytest.raises(RuntimeError, match="delete failed"):
+        await channel.purge(limit=300)
+
+    assert http.cancelled == 2 and http.bulk_deleted == []
@@ -0,0 +1,234 @@
+import asyncio
+import types
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from lefi.errors import HTTPException
+from lefi.http import HTTPClient, Route
+from lefi.ratelimiter import BucketState, Ratelimiter
+
+
+@types.coroutine
+def switch():
+    # Lets other tasks run without going through the patched asyncio.sleep.
+    yield
+
+
+class FakeResponse:
+    def __init__(self, status: int, data: Any = None, headers: Optional[Dict[str, str]] = None) -> None:
+        self.status = status
+        self.data = {} if data is None else data
+        self.headers = headers or {}
+        self.session: Optional[FakeSession] = None
+
+    async def __aenter__(self) -> "FakeResponse":
+        assert self.session is not None
+        self.session.in_flight += 1
+        self.session.max_in_flight = max(self.session.max_in_flight, self.session.in_flight)
+
+        await switch()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        assert self.session is not None
+        self.session.in_flight -= 1
+
+
+class FakeSession:
+    def __init__(self, responses: List[FakeResponse]) -> None:
+        self.responses = responses
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def request(self, method: str, url: str, **kwargs: Any) -> FakeResponse:
+        self.requests += 1
+
+        response = self.responses.pop(0)
+        response.session = self
+        return response
+
+
+class FakeHTTP:
+    ERRORS = HTTPClient.ERRORS
+
+    def __init__(self, *responses: FakeResponse) -> None:
+        self.loop = asyncio.get_running_loop()
+        self.session = FakeSession(list(responses))
+        self.buckets: Dict[Any, Any] = {}
+        self.global_ratelimit = asyncio.Event()
+        self.global_ratelimit.set()
+        self.concurrency = asyncio.Semaphore(HTTPClient.MAX_CONCURRENCY)
+
+    @staticmethod
+    async def json_or_text(resp: FakeResponse) -> Any:
+        return resp.data
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> List[float]:
+    # Backoffs and ratelimit waits are recorded instead of actually being waited on.
+    delays: List[float] = []
+    sleep = asyncio.sleep
+
+    async def fake_sleep(delay: float, *args: Any) -> None:
+        delays.append(delay)
+        await sleep(0)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    return delays
+
+
+async def request(http: FakeHTTP, method: str = "GET", route: Optional[Route] = None) -> Any:
+    route = route or Route("/channels/1/messages", channel_id=1)
+    return await Ratelimiter(http, route, method).request()  # type: ignore
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status", [500, 504])
+async def test_post_is_not_retried_when_possibly_processed(sleeps: List[float], status: int) -> None:
+    http = FakeHTTP(FakeResponse(status), FakeResponse(200))
+
+    with pytest.raises(HTTPException):
+        await request(http, "POST")
+
+    assert http.session.requests == 1 and sleeps == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status", [502, 503])
+async def test_post_is_retried_when_unprocessed(sleeps: List[float], status: int) -> None:
+    http = FakeHTTP(FakeResponse(status), FakeResponse(200, {"id": "1"}))
+
+    assert await request(http, "POST") == {"id": "1"}
+    assert http.session.requests == 2 and len(sleeps) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status", [500, 502, 503, 504])
+async def test_idempotent_methods_are_retried(sleeps: List[float], status: int) -> None:
+    http = FakeHTTP(FakeResponse(status), FakeResponse(200, {"id": "1"}))
+
+    assert await request(http, "GET") == {"id": "1"}
+    assert http.session.requests == 2 and len(sleeps) == 1
+
+
+@pytest.mark.asyncio
+async def test_retries_are_exhausted(sleeps: List[float]) -> None:
+    http = FakeHTTP(*(FakeResponse(503) for _ in range(Ratelimiter.MAX_RETRIES)))
+
+    with pytest.raises(HTTPException):
+        await request(http, "GET")
+
+    assert http.session.requests == Ratelimiter.MAX_RETRIES
+    # The backoff grows exponentially, with up to a second of jitter on top.
+    assert [int(delay) for delay in sleeps] == [2**attempt for attempt in range(Ratelimiter.MAX_RETRIES - 1)]
+
+
+def headers(limit: int, remaining: int, reset_after: float = 1.0, reset: str = "1") -> Dict[str, str]:
+    return {
+        "X-RateLimit-Limit": str(limit),
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset-After": str(reset_after),
+        "X-RateLimit-Reset": reset,
+    }
+
+
+@pytest.mark.asyncio
+async def test_bucket_is_seeded_from_headers() -> None:
+    loop = asyncio.get_running_loop()
+    state = BucketState(loop)
+
+    # Nothing is known about the bucket until the first response comes back.
+    assert not state.take() and state.delay() == 0
+
+    state.update(headers(5, 4, reset_after=2.5))
+    assert state.limit == 5 and state.remaining == 4
+    assert 2.4 < state.reset_at - loop.time() <= 2.5
+
+
+@pytest.mark.asyncio
+async def test_bucket_keeps_lowest_remaining_within_a_window() -> None:
+    state = BucketState(asyncio.get_running_loop())
+
+    state.update(headers(5, 2))
+    state.update(headers(5, 3))
+    assert state.remaining == 2
+
+    # A new reset window starts over from its own count.
+    state.update(headers(5, 4, reset="2"))
+    assert state.remaining == 4
+
+
+@pytest.mark.asyncio
+async def test_bucket_drains_and_waits_for_reset(sleeps: List[float]) -> None:
+    state = BucketState(asyncio.get_running_loop())
+    state.update(headers(2, 2, reset_after=3.0))
+
+    assert state.take() and state.take()
+    assert state.remaining == 0 and 2.9 < state.delay() <= 3.0
+
+    await state.wait()
+    assert len(sleeps) == 1 and 2.9 < sleeps[0] <= 3.0
+    assert state.remaining == 2
+
+
+@pytest.mark.asyncio
+async def test_first_request_learns_the_limits_alone(sleeps: List[float]) -> None:
+    responses = [FakeResponse(200, headers=headers(5, 5 - i)) for i in range(1, 4)]
+    http = FakeHTTP(*responses)
+
+    route = Route("/channels/1/messages", channel_id=1)
+    await asyncio.gather(*(request(http, route=route) for _ in range(3)))
+
+    # The first request is sent on its own. Once the headers are known the rest go out together.
+    assert http.session.requests == 3 and http.session.max_in_flight == 2
+    assert http.buckets[route.bucket].remaining == 2 and sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_drained_bucket_waits_before_requesting(sleeps: List[float]) -> None:
+    http = FakeHTTP(
+        FakeResponse(200, headers=headers(1, 0, reset_after=4.0)),
+        FakeResponse(200, headers=headers(1, 0, reset_after=4.0, reset="2")),
+    )
+
+    route = Route("/channels/1/messages", channel_id=1)
+    await request(http, route=route)
+    assert sleeps == []
+
+    await request(http, route=route)
+    assert len(sleeps) == 1 and 3.9 < sleeps[0] <= 4.0
+
+
+@pytest.mark.asyncio
+async def test_route_ratelimit_is_retried(sleeps: List[float]) -> None:
+    http = FakeHTTP(
+        FakeResponse(429, {"retry_after": 1.5, "global": False}),
+        FakeResponse(200, {"id": "1"}),
+    )
+
+    assert await request(http) == {"id": "1"}
+    assert sleeps == [1.5] and http.global_ratelimit.is_set()
+
+
+@pytest.mark.asyncio
+async def test_global_ratelimit_blocks_every_request(sleeps: List[float]) -> None:
+    http = FakeHTTP(
+        FakeResponse(429, {"retry_after": 0.05, "global": True}),
+        FakeResponse(200, {"id": "1"}),
+        FakeResponse(200, {"id": "2"}),
+    )
+
+    first = asyncio.create_task(request(http))
+    while http.session.requests == 0 or http.global_ratelimit.is_set():
+        await switch()
+
+    # Requests to other routes wait on the global ratelimit as well.
+    second = asyncio.create_task(request(http, route=Route("/guilds/1", guild_id=1)))
+    await switch()
+    assert http.session.requests == 1
+
+    assert await first == {"id": "1"} and await second == {"id": "2"}
+    assert sleeps == [] and http.session.requests == 3
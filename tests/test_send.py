@@ -0,0 +1,62 @@
+import pytest
+
+import lefi
+from lefi.objects.base import Messageable
+
+
+class FakeHTTP:
+    def __init__(self) -> None:
+        self.sent: list = []
+
+    async def send_message(self, **kwargs):
+        self.sent.append(kwargs)
+        return {"id": "1"}
+
+
+class FakeClient:
+    def __init__(self) -> None:
+        self.http = FakeHTTP()
+
+
+class FakeState:
+    def __init__(self) -> None:
+        self.client = FakeClient()
+
+    def create_message(self, data, channel):
+        return int(data["id"])
+
+
+class FakeChannel(Messageable):
+    id = 1
+
+    def __init__(self) -> None:
+        self._state = FakeState()  # type: ignore
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("kwargs", [{}, {"embeds": []}, {"files": [], "rows": [], "stickers": []}])
+async def test_empty_message_is_not_sent(kwargs: dict) -> None:
+    channel = FakeChannel()
+
+    with pytest.raises(ValueError, match="Cannot send an empty message."):
+        await channel.send(**kwargs)
+
+    assert channel._state.client.http.sent == []
+
+
+@pytest.mark.asyncio
+async def test_empty_embeds_are_left_out() -> None:
+    channel = FakeChannel()
+    await channel.send("hi", embeds=[])
+
+    (sent,) = channel._state.client.http.sent
+    assert sent["content"] == "hi" and sent["embeds"] is None
+
+
+@pytest.mark.asyncio
+async def test_embed_only_message_is_sent() -> None:
+    channel = FakeChannel()
+    await channel.send(embeds=[lefi.Embed(title="title")])
+
+    (sent,) = channel._state.client.http.sent
+    assert sent["content"] is None and sent["embeds"] == [{"title": "title"}]